@@ -0,0 +1,185 @@
+# aplab_py/algorithms/progress.py
+
+"""Sorting large NumPy arrays while keeping a bounded picture of it.
+
+Step-by-step recordings (see recorder.py) grow with the number of
+operations, which is hopeless for 10^5 elements. Here each algorithm
+runs as whole-array NumPy passes, split into chunks of equal work, and
+yields the array between chunks. A `ProgressMatrix` keeps a fixed number
+of those snapshots, each averaged down to a fixed number of columns, so
+memory and the heatmap drawn from it stay the same size whatever the
+input size:
+
+    matrix = ProgressMatrix()
+    for values, work in merge_sort_passes(random_array(100_000)):
+        matrix.add(values, work)
+    matrix.levels(99_999)   # rows x columns, 0-255
+"""
+
+from typing import Callable, Dict, Iterator, Tuple
+
+from aplab_py.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+HEATMAP_ROWS = 128
+HEATMAP_COLUMNS = 256
+# Compare-exchanges odd-even transposition sort may do before giving up
+WORK_BUDGET = 5 * 10**8
+# Snapshots per merge or radix pass
+CHUNKS_PER_PASS = 8
+
+Passes = Iterator[Tuple["np.ndarray", int]]
+
+
+def random_array(size: int, order: str = "random", seed: int = 0):
+    """A permutation of 0..size-1: random, reversed or nearly sorted"""
+    rng = np.random.default_rng(seed)
+    if order == "reversed":
+        return np.arange(size - 1, -1, -1)
+    values = np.arange(size)
+    if order == "nearly sorted":
+        i = rng.integers(0, size, size // 100 + 1)
+        j = rng.integers(0, size, size // 100 + 1)
+        values[i], values[j] = values[j], values[i]
+        return values
+    return rng.permutation(size)
+
+
+def downsample(values, columns: int = HEATMAP_COLUMNS):
+    """Means over `columns` equal slices of `values` (or `values` if shorter)"""
+    if len(values) <= columns:
+        return values.astype(float)
+    edges = np.linspace(0, len(values), columns + 1).astype(np.intp)
+    return np.add.reduceat(values, edges[:-1], dtype=float) / np.diff(edges)
+
+
+class ProgressMatrix:
+    """Downsampled snapshots of an array, evenly spaced over the run.
+
+    Snapshots are kept every `stride` additions; when `rows` are full,
+    every other one is dropped and the stride doubles. The run's length
+    need not be known up front, and skipped snapshots cost nothing.
+    """
+
+    def __init__(self, rows: int = HEATMAP_ROWS, columns: int = HEATMAP_COLUMNS):
+        self.rows = rows
+        self.columns = columns
+        self.snapshots = []
+        self.work = []
+        self.stride = 1
+        self.added = 0
+        self.last = None
+
+    def add(self, values, work: int):
+        if self.added % self.stride == 0:
+            self.snapshots.append(downsample(values, self.columns))
+            self.work.append(work)
+            if len(self.snapshots) == self.rows:
+                self.snapshots = self.snapshots[::2]
+                self.work = self.work[::2]
+                self.stride *= 2
+        self.added += 1
+        self.last = (values, work)
+
+    def finish(self):
+        """Make sure the final state is the last row"""
+        if self.last is not None and self.work[-1] != self.last[1]:
+            values, work = self.last
+            self.snapshots.append(downsample(values, self.columns))
+            self.work.append(work)
+
+    def levels(self, top: int):
+        """The snapshots as 0-255 levels, 255 standing for `top`"""
+        matrix = np.vstack(self.snapshots)
+        return np.rint(matrix * (255 / max(top, 1))).astype(np.uint8)
+
+
+def _sorted(values) -> bool:
+    return bool(np.all(values[:-1] <= values[1:]))
+
+
+def odd_even_passes(values, budget: int = WORK_BUDGET) -> Passes:
+    """Odd-even transposition sort, i.e. bubble sort one pass at a time.
+
+    Every compare-exchange of a pass is done at once. Stops when sorted or
+    when `budget` compare-exchanges are spent.
+    """
+    values = values.copy()
+    n = len(values)
+    work = 0
+    yield values, work
+    for start in range(n):
+        if work >= budget or (start % 2 == 0 and _sorted(values)):
+            break
+        first = start % 2
+        left = values[first:n-1:2]
+        right = values[first+1:n:2]
+        low = np.minimum(left, right)
+        values[first+1:n:2] = np.maximum(left, right)
+        values[first:n-1:2] = low
+        work += len(low)
+        yield values, work
+
+
+def merge_sort_passes(values) -> Passes:
+    """Bottom-up merge sort: runs of width 1, 2, 4, ... merged in pairs"""
+    values = values.copy()
+    n = len(values)
+    work = 0
+    yield values, work
+    width = 1
+    while width < n:
+        block = 2 * width
+        full = n // block * block
+        blocks = values[:full].reshape(-1, block)
+        step = max(1, len(blocks) // CHUNKS_PER_PASS)
+        for start in range(0, len(blocks), step):
+            # Each row is two sorted runs; a stable sort merges them
+            blocks[start:start+step].sort(axis=1, kind="stable")
+            work += blocks[start:start+step].size
+            yield values, work
+        if full < n:
+            values[full:].sort(kind="stable")
+            work += n - full
+            yield values, work
+        width = block
+
+
+def radix_sort_passes(values, bits: int = 4) -> Passes:
+    """LSD radix sort on `bits`-bit digits; each pass a stable scatter"""
+    values = values.copy()
+    n = len(values)
+    work = 0
+    yield values, work
+    top = int(values.max()) if n else 0
+    shift = 0
+    while top >> shift:
+        digits = (values >> shift) & ((1 << bits) - 1)
+        order = np.argsort(digits, kind="stable")
+        placed = values.copy()
+        # Show the output filling up chunk by chunk
+        step = max(1, n // CHUNKS_PER_PASS)
+        for start in range(0, n, step):
+            placed[start:start+step] = values[order[start:start+step]]
+            work += len(order[start:start+step])
+            yield placed, work
+        values = placed
+        shift += bits
+
+
+ALGORITHMS: Dict[str, Callable[..., Passes]] = {
+    "Bubble sort (odd-even passes)": odd_even_passes,
+    "Merge sort (bottom-up)": merge_sort_passes,
+    "Radix sort (LSD, 4-bit digits)": radix_sort_passes,
+}
+
+
+def trace(algorithm: str, values, rows: int = HEATMAP_ROWS,
+          columns: int = HEATMAP_COLUMNS) -> Tuple[ProgressMatrix, bool]:
+    """Run `algorithm` on `values`; the matrix and whether it finished"""
+    matrix = ProgressMatrix(rows, columns)
+    for state, work in ALGORITHMS[algorithm](values):
+        matrix.add(state, work)
+    matrix.finish()
+    return matrix, _sorted(matrix.last[0])
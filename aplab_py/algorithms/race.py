@@ -0,0 +1,264 @@
+# aplab_py/algorithms/race.py
+
+"""Sorting algorithms raced against each other on a process pool.
+
+Every algorithm counts its comparisons and swaps (element moves, for the
+ones that shift or merge instead of swapping). A race runs each of them
+on the same input, and on prefixes of it for the growth curves, as
+separate jobs on a process pool shared by every session of the server
+process:
+
+    current = start_race(values)     # returns at once
+    ...
+    if current.done():
+        current.results()            # {(algorithm, size): Result}
+
+The Streamlit script thread never runs a sort itself, so a long race
+does not hold up other sessions; the pool's size bounds the CPU all
+races together can use.
+"""
+
+import logging
+import multiprocessing
+import random
+import sys
+import threading
+import time
+import types
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from aplab_py.config.setting import RACE_WORKERS
+
+logger = logging.getLogger(__name__)
+
+# The race input is cut into these fractions for the growth curves
+GROWTH_FRACTIONS = (0.125, 0.25, 0.5, 1.0)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Result:
+    comparisons: int
+    swaps: int
+    seconds: float
+
+
+class Counter:
+    __slots__ = ("comparisons", "swaps")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+
+
+def bubble_sort(values: List, count: Counter):
+    n = len(values)
+    for i in range(n):
+        swapped = False
+        for j in range(n - i - 1):
+            count.comparisons += 1
+            if values[j] > values[j + 1]:
+                values[j], values[j + 1] = values[j + 1], values[j]
+                count.swaps += 1
+                swapped = True
+        if not swapped:
+            break
+
+
+def insertion_sort(values: List, count: Counter):
+    for i in range(1, len(values)):
+        item = values[i]
+        j = i - 1
+        while j >= 0:
+            count.comparisons += 1
+            if values[j] <= item:
+                break
+            values[j + 1] = values[j]
+            count.swaps += 1
+            j -= 1
+        values[j + 1] = item
+
+
+def merge_sort(values: List, count: Counter):
+    if len(values) < 2:
+        return
+    middle = len(values) // 2
+    left, right = values[:middle], values[middle:]
+    merge_sort(left, count)
+    merge_sort(right, count)
+    i = j = 0
+    for k in range(len(values)):
+        if j == len(right) or (i < len(left) and _le(left[i], right[j], count)):
+            values[k] = left[i]
+            i += 1
+        else:
+            values[k] = right[j]
+            j += 1
+        count.swaps += 1
+
+
+def _le(a, b, count: Counter) -> bool:
+    count.comparisons += 1
+    return a <= b
+
+
+def quick_sort(values: List, count: Counter):
+    """Lomuto partitions around the middle element, smaller side first"""
+    stack = [(0, len(values) - 1)]
+    while stack:
+        low, high = stack.pop()
+        if low >= high:
+            continue
+        middle = (low + high) // 2
+        values[middle], values[high] = values[high], values[middle]
+        count.swaps += 1
+        pivot = values[high]
+        store = low
+        for i in range(low, high):
+            count.comparisons += 1
+            if values[i] < pivot:
+                values[i], values[store] = values[store], values[i]
+                count.swaps += 1
+                store += 1
+        values[store], values[high] = values[high], values[store]
+        count.swaps += 1
+        stack.extend(sorted([(low, store - 1), (store + 1, high)],
+                            key=lambda part: part[0] - part[1]))
+
+
+def builtin_sorted(values: List, count: Counter):
+    """Python's own sort (Timsort); only its comparisons can be counted"""
+
+    class Counted:
+        __slots__ = ("value",)
+
+        def __init__(self, value):
+            self.value = value
+
+        def __lt__(self, other):
+            count.comparisons += 1
+            return self.value < other.value
+
+    values[:] = [item.value for item in sorted(map(Counted, values))]
+
+
+ALGORITHMS: Dict[str, Callable[[List, Counter], None]] = {
+    "Bubble sort": bubble_sort,
+    "Insertion sort": insertion_sort,
+    "Merge sort": merge_sort,
+    "Quick sort": quick_sort,
+    "sorted()": builtin_sorted,
+}
+
+
+def run_algorithm(name: str, values: Sequence) -> Result:
+    """Sort a copy of `values` with `name`; runs in a pool process"""
+    values = list(values)
+    count = Counter()
+    start = time.perf_counter()
+    ALGORITHMS[name](values, count)
+    seconds = time.perf_counter() - start
+    if any(values[i] > values[i + 1] for i in range(len(values) - 1)):
+        raise AssertionError(f"{name} left the list unsorted")
+    return Result(count.comparisons, count.swaps, seconds)
+
+
+def race_input(size: int, seed: Optional[int] = None) -> List[int]:
+    return random.Random(seed).sample(range(size * 10), size)
+
+
+def pool() -> ProcessPoolExecutor:
+    """The process-wide race pool, started on first use.
+
+    Workers come from a fork server, a fresh single-threaded process
+    with this module preloaded: forking the Streamlit server itself
+    would copy locks held by its other threads into the workers. They
+    are all started here, under a bare `__main__` (see `_bare_main`).
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload([__name__])
+            executor = ProcessPoolExecutor(max_workers=RACE_WORKERS, mp_context=context)
+            with _bare_main():
+                # Each job no worker is idle for starts one more worker
+                for _ in range(RACE_WORKERS):
+                    executor.submit(int)
+            _pool = executor
+        return _pool
+
+
+@contextmanager
+def _bare_main():
+    """Start processes without them re-running `__main__`.
+
+    A new multiprocessing process imports the parent's `__main__` first,
+    which under Streamlit is the script of whichever session ran last
+    (app.py, or a test's script). For the moment the workers start,
+    `__main__` is an empty module they leave alone.
+    """
+    main = sys.modules["__main__"]
+    bare = sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        # Unless a script run has installed its own meanwhile
+        if sys.modules["__main__"] is bare:
+            sys.modules["__main__"] = main
+
+
+def _reset_pool(broken: ProcessPoolExecutor):
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+class Race:
+    """The jobs of one race, keyed by (algorithm, input size)"""
+
+    def __init__(self, futures: Dict[Tuple[str, int], Future]):
+        self.futures = futures
+        self.started = time.monotonic()
+
+    @property
+    def finished(self) -> int:
+        return sum(future.done() for future in self.futures.values())
+
+    def done(self) -> bool:
+        return self.finished == len(self.futures)
+
+    def cancel(self):
+        for future in self.futures.values():
+            future.cancel()
+
+    def results(self) -> Dict[Tuple[str, int], Result]:
+        """Results of the finished jobs (raises if a job failed)"""
+        return {key: future.result() for key, future in self.futures.items()
+                if future.done() and not future.cancelled()}
+
+
+def start_race(values: Sequence, algorithms: Sequence[str] = tuple(ALGORITHMS)) -> Race:
+    """Queue every algorithm on every growth-curve prefix of `values`"""
+    sizes = sorted({max(1, round(len(values) * f)) for f in GROWTH_FRACTIONS})
+    executor = pool()
+    try:
+        # Smallest inputs first, so the curves start filling in straight away
+        return Race({
+            (name, size): executor.submit(run_algorithm, name, tuple(values[:size]))
+            for size in sizes
+            for name in algorithms
+        })
+    except BrokenProcessPool:
+        # A worker died (killed, out of memory); start over with a new pool
+        logger.warning("Race pool broken, restarting it")
+        _reset_pool(executor)
+        return start_race(values, algorithms)
@@ -0,0 +1,128 @@
+# aplab_py/algorithms/recorder.py
+
+"""Compact recordings of what an algorithm does to a list.
+
+Keeping a copy of the list after every step costs O(n) per step, O(n^3)
+for bubble sort. A `StepRecorder` keeps the operations instead - one
+(kind, i, j) record each, in typed arrays - plus a copy of the list every
+`interval` operations, so any step is rebuilt from the nearest checkpoint
+by replaying at most `interval` operations:
+
+    recorder = StepRecorder(values)
+    if recorder.compare(0, 1):   # values[0] > values[1]
+        recorder.swap(0, 1)
+    recorder.state(len(recorder))   # the list after every operation
+
+Step k is the list after the first k operations; step 0 is the input.
+The algorithm runs against the recorder's current list, so the recording
+is complete as soon as the algorithm returns.
+"""
+
+from array import array
+from typing import Iterable, Iterator, List, Sequence
+
+COMPARE = 0
+SWAP = 1
+SET = 2
+
+# Operations between checkpoints, at least; see StepRecorder
+CHECKPOINT_INTERVAL = 256
+
+
+class StepRecorder:
+    """An operation log over a list of numbers, with periodic checkpoints.
+
+    The checkpoint interval is at least the list size, so checkpoints
+    never take more room than the operations they cover.
+    """
+
+    def __init__(self, values: Sequence, interval: int = CHECKPOINT_INTERVAL):
+        typecode = "q" if all(isinstance(value, int) for value in values) else "d"
+        self.current = array(typecode, values)
+        self.interval = max(interval, len(self.current), 1)
+        self.kinds = array("B")
+        self.first = array("I")
+        self.second = array("I")
+        # Values written by SET operations; `second` indexes into it
+        self.written = array(typecode)
+        self.checkpoints: List[array] = [array(typecode, self.current)]
+
+    def __len__(self) -> int:
+        """Number of operations recorded"""
+        return len(self.kinds)
+
+    @property
+    def size(self) -> int:
+        return len(self.current)
+
+    @property
+    def nbytes(self) -> int:
+        logs = (self.kinds, self.first, self.second, self.written)
+        return (sum(log.itemsize * len(log) for log in logs)
+                + sum(c.itemsize * len(c) for c in self.checkpoints))
+
+    def _record(self, kind: int, i: int, j: int):
+        self.kinds.append(kind)
+        self.first.append(i)
+        self.second.append(j)
+        if len(self.kinds) % self.interval == 0:
+            self.checkpoints.append(array(self.current.typecode, self.current))
+
+    def compare(self, i: int, j: int) -> bool:
+        """Record comparing items i and j; True if item i is the larger"""
+        self._record(COMPARE, i, j)
+        return self.current[i] > self.current[j]
+
+    def swap(self, i: int, j: int):
+        current = self.current
+        current[i], current[j] = current[j], current[i]
+        self._record(SWAP, i, j)
+
+    def set(self, i: int, value):
+        self.current[i] = value
+        self.written.append(value)
+        self._record(SET, i, len(self.written) - 1)
+
+    def _apply(self, values: array, start: int, stop: int):
+        kinds, first, second, written = self.kinds, self.first, self.second, self.written
+        for k in range(start, stop):
+            kind = kinds[k]
+            if kind == SWAP:
+                i, j = first[k], second[k]
+                values[i], values[j] = values[j], values[i]
+            elif kind == SET:
+                values[first[k]] = written[second[k]]
+
+    def state(self, step: int) -> List:
+        """The list after the first `step` operations"""
+        if not 0 <= step <= len(self):
+            raise IndexError(f"step {step} out of range 0..{len(self)}")
+        start = step // self.interval * self.interval
+        values = array(self.current.typecode, self.checkpoints[step // self.interval])
+        self._apply(values, start, step)
+        return values.tolist()
+
+    def replay(self, steps: Iterable[int]) -> Iterator[List]:
+        """The list at each of `steps`, which must be increasing.
+
+        Moves forward from one step to the next, or jumps to a checkpoint
+        when that is shorter, so a pass over the whole recording replays
+        each operation at most once.
+        """
+        values, position = None, -1
+        for step in steps:
+            if not 0 <= step <= len(self):
+                raise IndexError(f"step {step} out of range 0..{len(self)}")
+            if step < position:
+                raise ValueError(f"steps must be increasing: {step} after {position}")
+            start = step // self.interval * self.interval
+            if values is None or position < start:
+                values = array(self.current.typecode, self.checkpoints[step // self.interval])
+                position = start
+            self._apply(values, position, step)
+            position = step
+            yield values.tolist()
+
+    def steps_after(self, *kinds: int) -> List[int]:
+        """The steps right after each operation of the given kinds"""
+        return [k + 1 for k, kind in enumerate(self.kinds) if kind in kinds]
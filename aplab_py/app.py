@@ -1,5 +1,15 @@
 import streamlit as st
-import importlib
+
+from aplab_py import routing
+from aplab_py.components import admin, cookies
+from aplab_py.config.setting import SESSION_STORE_MAX_AGE_SECONDS
+from aplab_py.i18n import catalogs as i18n
+from aplab_py.registry import TopicRegistry
+from aplab_py.search import index as search
+from aplab_py.state import persistence
+from aplab_py.state import topic_state
+from aplab_py.state.accounting import accounts
+from aplab_py.topics import discovery
 
 st.set_page_config(
     page_title="APlab",
@@ -9,68 +19,131 @@ st.set_page_config(
 
 
 # Get language from URL parameters
-current_lang = st.query_params.get('lang', ['en'])[0]
-
-
-TOPICS = {
-    "0. Programming Fundamentals": {
-        "0.1 Programming Basics": "aplab_py.topics.t00_fundamentals.t01_programming_basics",
-    },
-    "1. Python Basics": {
-        "1.1 Variables": "aplab_py.topics.t01_basics.t01_variables",
-        "1.2 Data Types": "aplab_py.topics.t01_basics.t02_data_types",
-        "1.3 Operations": "aplab_py.topics.t01_basics.t03_operations"
-    },
-    # "2. Control Flow": {
-    #     "2.1 Conditionals": "aplab_py.topics.t02_control_flow.t01_conditionals",
-    #     "2.2 Loops": "aplab_py.topics.t02_control_flow.t02_loops",
-    #     "2.3 Functions": "aplab_py.topics.t02_control_flow.t03_functions"
-    # },
-    # "3. Data Structures": {
-    #     "3.1 Lists": "aplab_py.topics.t03_data_structures.t01_lists",
-    #     "3.2 Dictionaries": "aplab_py.topics.t03_data_structures.t02_dictionaries",
-    #     "3.3 Sets": "aplab_py.topics.t03_data_structures.t03_sets"
-    # }
-}
-
-# Translations
-TRANSLATIONS = {
-    'en': {
-        'title': 'APlab - Interactive Python Learning',
-        'select_category': 'Select Category',
-        'select_topic': 'Select Topic',
-        'error_loading': 'Error loading topic'
-    },
-    'ru': {
-        'title': 'APlab - Интерактивное Изучение Python',
-        'select_category': 'Выберите Категорию',
-        'select_topic': 'Выберите Тему',
-        'error_loading': 'Ошибка загрузки темы'
-    }
-}
+current_lang = st.query_params.get('lang', i18n.DEFAULT_LOCALE)
+MESSAGES = i18n.catalog(current_lang)
+
+
+# Sidebar tree built from the topic manifest (python -m aplab_py.build),
+# no topic module is imported to render it; loaded once per process
+TOPIC_MANIFEST = discovery.manifest()
+TOPICS = discovery.as_topics(TOPIC_MANIFEST)
 
 def get_text(key):
-    return TRANSLATIONS[current_lang].get(key, TRANSLATIONS['en'][key])
+    return MESSAGES[f"app.{key}"]
+
+@st.cache_resource
+def get_registry():
+    """One registry per server process, warmed up on the first script run"""
+    registry = TopicRegistry(TOPICS)
+    registry.warm_up()
+    return registry
+
+def sync_topic_selection():
+    """Point the topic selectbox at the first topic of a newly picked category"""
+    st.session_state.topic = next(iter(TOPICS[st.session_state.category]))
+
+def open_topic(topic_id):
+    """Search result callback: select the topic before the sidebar renders"""
+    route = routing.resolve(TOPIC_MANIFEST, {routing.TOPIC_PARAM: topic_id})
+    st.session_state.category = route.category
+    st.session_state.topic = route.title
+    st.session_state.search = ""
+
+def search_sidebar():
+    query = st.sidebar.text_input(get_text('search'), key="search")
+    if not query:
+        return
+    index = search.get_index()
+    results = index.search(query, limit=5)
+    for result in results:
+        st.sidebar.button(
+            result.title,
+            key=f"search_{result.topic_id}",
+            on_click=open_topic,
+            args=(result.topic_id,),
+            use_container_width=True
+        )
+    if not results:
+        st.sidebar.caption(get_text('no_results'))
+    words = search.tokenize(query)
+    completions = [term for term in index.complete(words[-1]) if term != words[-1]] if words else []
+    if completions:
+        st.sidebar.caption(f"{get_text('suggestions')}: {', '.join(completions)}")
+
+def current_learner():
+    """The learner id in the browser's cookie, given one if missing; None without a store.
+
+    Not in the URL: whoever opened a copied lesson link would load, and
+    then overwrite, the state of the learner who shared it.
+    """
+    # Links from when the id was in the URL
+    if routing.LEARNER_PARAM in st.query_params:
+        st.query_params.pop(routing.LEARNER_PARAM)
+    if persistence.backend() is None:
+        return None
+    cookie = cookies.get_cookie(persistence.LEARNER_COOKIE)
+    if "learner" not in st.session_state:
+        valid = cookie is not None and persistence.LEARNER_ID.fullmatch(cookie)
+        st.session_state.learner = cookie if valid else persistence.new_learner_id()
+    learner = st.session_state.learner
+    # The cookies stay as the session found them, so set it once
+    if cookie != learner and not st.session_state.get("learner_cookie_set"):
+        cookies.set_cookie(persistence.LEARNER_COOKIE, learner, SESSION_STORE_MAX_AGE_SECONDS)
+        st.session_state.learner_cookie_set = True
+    return learner
 
 def main():
+    # Loads back the session's topic state if it was spilled while idle
+    accounts.touch(current_learner())
+    if admin.requested():
+        admin.show()
+        return
+
     st.title(get_text('title'))
 
+    # First run of a session: start on the topic named in the URL instead
+    # of rendering the first topic and rerunning
+    if "category" not in st.session_state:
+        route = routing.resolve(TOPIC_MANIFEST, st.query_params)
+        st.session_state.category = route.category
+        st.session_state.topic = route.title
+
     st.sidebar.title(get_text('select_category'))
+    search_sidebar()
 
     selected_category = st.sidebar.selectbox(
         get_text('select_category'),
-        list(TOPICS.keys())
+        list(TOPICS.keys()),
+        key="category",
+        on_change=sync_topic_selection
     )
 
     selected_topic = st.sidebar.selectbox(
         get_text('select_topic'),
-        list(TOPICS[selected_category].keys())
+        list(TOPICS[selected_category].keys()),
+        key="topic"
     )
 
     module_path = TOPICS[selected_category][selected_topic]
+    route = routing.find(TOPIC_MANIFEST, module_path)
+    if st.query_params.get(routing.TOPIC_PARAM) != route.topic_id:
+        st.query_params[routing.TOPIC_PARAM] = route.topic_id
+        st.query_params.pop(routing.TAB_PARAM, None)
+
+    registry = get_registry()
+    # Learners usually go on to the next topic; import it while this one renders
+    upcoming = routing.next_route(TOPIC_MANIFEST, route)
+    if upcoming is not None:
+        registry.prefetch(upcoming.module)
+
+    # Topics left long ago give back their memory
+    for _, dropped in topic_state.visit(module_path):
+        accounts.release(dropped)
+
     try:
-        module = importlib.import_module(module_path)
-        module.show()
+        module = registry.load(module_path)
+        with accounts.namespace(route.topic_id):
+            module.show()
     except Exception as e:
         st.error(f"{get_text('error_loading')}: {str(e)}")
         st.error(f"Module path: {module_path}")
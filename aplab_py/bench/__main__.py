@@ -0,0 +1,28 @@
+# aplab_py/bench/__main__.py
+
+"""Benchmarks: `python -m aplab_py.bench <command>`"""
+
+import argparse
+import sys
+
+from aplab_py.bench import coldstart, containers, figures, startup
+
+COMMANDS = {
+    "coldstart": coldstart,
+    "containers": containers,
+    "figures": figures,
+    "startup": startup,
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aplab_py.bench")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, module in COMMANDS.items():
+        module.add_arguments(commands.add_parser(name, help=module.__doc__))
+    args = parser.parse_args(argv)
+    return COMMANDS[args.command].run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+# aplab_py/bench/coldstart.py
+
+"""Cold-start time of aplab_py.app plus the default topic, against a budget"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+from aplab_py.config.setting import COLD_START_BUDGET_SECONDS, COLD_START_REPEATS
+
+HEAVY_MODULES = ["numpy", "pandas", "plotly.graph_objects"]
+
+# Runs in a fresh interpreter so nothing is already in sys.modules
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import aplab_py.app as app
+category = next(iter(app.TOPICS.values()))
+module_path = next(iter(category.values()))
+__import__(module_path)
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "default_topic": module_path,
+    "heavy_modules": [name for name in %r if name in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def measure() -> dict:
+    """One cold import in a clean subprocess"""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def add_arguments(parser):
+    parser.add_argument("--budget", type=float, default=COLD_START_BUDGET_SECONDS,
+                        help="fail when the median cold start is slower (seconds)")
+    parser.add_argument("--repeats", type=int, default=COLD_START_REPEATS)
+    parser.add_argument("--json", dest="json_path",
+                        help="also write the measurements to this file")
+
+
+def run(args) -> int:
+    samples = [measure() for _ in range(args.repeats)]
+    seconds = [sample["seconds"] for sample in samples]
+    median = statistics.median(seconds)
+    report = {
+        "default_topic": samples[0]["default_topic"],
+        "heavy_modules": samples[0]["heavy_modules"],
+        "samples": seconds,
+        "median": median,
+        "budget": args.budget,
+        "passed": median <= args.budget,
+    }
+
+    print(f"default topic: {report['default_topic']}")
+    print(f"heavy modules imported: {', '.join(report['heavy_modules']) or 'none'}")
+    print(f"cold start: median {median:.3f}s over {len(seconds)} runs "
+          f"(min {min(seconds):.3f}s, max {max(seconds):.3f}s), budget {args.budget:.3f}s")
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if not report["passed"]:
+        print("FAILED: cold start is over budget", file=sys.stderr)
+        return 1
+    return 0
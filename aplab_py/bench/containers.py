@@ -0,0 +1,121 @@
+# aplab_py/bench/containers.py
+
+"""Build and serialisation time of the container figures by element count"""
+
+import json
+import string
+import time
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from aplab_py.components.visualizations import mapping_figure, sequence_figure, string_figure
+
+SIZES = [10, 100, 1000, 5000]
+# The per-element builders get slow fast; only time them up to this size
+LEGACY_MAX_SIZE = 100
+
+
+def legacy_sequence_figure(items):
+    """The per-element list figure sequence_figure replaced, for comparison"""
+    fig = go.Figure()
+    for i, item in enumerate(items):
+        fig.add_shape(type="rect", x0=i-0.4, x1=i+0.4, y0=-0.4, y1=0.4,
+                      line=dict(color="RoyalBlue"), fillcolor="LightSkyBlue")
+        fig.add_trace(go.Scatter(x=[i], y=[0], mode='text', text=[item],
+                                 textposition='middle center', showlegend=False))
+        fig.add_trace(go.Scatter(x=[i], y=[-0.6], mode='text', text=[f"Index: {i}"],
+                                 textposition='top center', showlegend=False))
+    return fig
+
+
+def legacy_mapping_figure(mapping):
+    fig = go.Figure()
+    for i, (key, value) in enumerate(mapping.items()):
+        fig.add_shape(type="rect", x0=0, x1=1, y0=i-0.4, y1=i+0.4,
+                      line=dict(color="RoyalBlue"), fillcolor="LightSkyBlue")
+        fig.add_shape(type="rect", x0=1, x1=2, y0=i-0.4, y1=i+0.4,
+                      line=dict(color="Green"), fillcolor="LightGreen")
+        fig.add_trace(go.Scatter(x=[0.5, 1.5], y=[i, i], mode='text',
+                                 text=[key, f"${value:.2f}"], showlegend=False))
+    return fig
+
+
+def legacy_string_figure(text):
+    fig = go.Figure()
+    for i, char in enumerate(text):
+        fig.add_trace(go.Scatter(x=[i], y=[1], mode='text', text=[char],
+                                 textfont=dict(size=20), name=f'Character {i}'))
+        fig.add_trace(go.Scatter(x=[i], y=[0], mode='text', text=[str(i)],
+                                 textfont=dict(size=14), name=f'Index {i}'))
+    return fig
+
+
+def inputs(size: int):
+    return {
+        "sequence": [f"item{i}" for i in range(size)],
+        "mapping": {f"key{i}": i * 1.5 for i in range(size)},
+        "string": (string.ascii_letters * (size // len(string.ascii_letters) + 1))[:size],
+    }
+
+
+BUILDERS = {
+    "sequence": (sequence_figure, legacy_sequence_figure),
+    "mapping": (lambda data: mapping_figure(data, lambda v: f"${v:.2f}"), legacy_mapping_figure),
+    "string": (string_figure, legacy_string_figure),
+}
+
+
+def measure(build, data, repeats: int) -> dict:
+    build_seconds = serialise_seconds = 0.0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fig = build(data)
+        built = time.perf_counter()
+        spec = pio.to_json(fig, validate=False)
+        build_seconds += built - start
+        serialise_seconds += time.perf_counter() - built
+    return {
+        "traces": len(fig.data),
+        "shapes": len(fig.layout.shapes),
+        "build_ms": build_seconds / repeats * 1000,
+        "serialise_ms": serialise_seconds / repeats * 1000,
+        "bytes": len(spec),
+    }
+
+
+def add_arguments(parser):
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--legacy-max", type=int, default=LEGACY_MAX_SIZE,
+                        help="largest size to time the per-element builders at (0 to skip)")
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+
+
+def run(args) -> int:
+    # Import numpy and fill plotly's validator caches before timing anything
+    warm_up = inputs(2)
+    for kind, builders in BUILDERS.items():
+        for build in builders:
+            measure(build, warm_up[kind], 1)
+    results = []
+    print(f"{'kind':<10} {'builder':<9} {'size':>6} {'traces':>7} {'shapes':>7} "
+          f"{'build ms':>9} {'json ms':>9} {'us/elem':>8}")
+    for size in args.sizes:
+        data = inputs(size)
+        for kind, (build, legacy) in BUILDERS.items():
+            variants = [("single", build)]
+            if size <= args.legacy_max:
+                variants.append(("legacy", legacy))
+            for name, builder in variants:
+                result = measure(builder, data[kind], args.repeats)
+                result.update(kind=kind, builder=name, size=size)
+                results.append(result)
+                per_element = (result["build_ms"] + result["serialise_ms"]) * 1000 / size
+                print(f"{kind:<10} {name:<9} {size:>6} {result['traces']:>7} {result['shapes']:>7} "
+                      f"{result['build_ms']:>9.1f} {result['serialise_ms']:>9.1f} {per_element:>8.1f}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
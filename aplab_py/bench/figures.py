@@ -0,0 +1,100 @@
+# aplab_py/bench/figures.py
+
+"""Build and serialisation time of the hot charts: go.Figure vs FigureSpec"""
+
+import json
+import time
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from aplab_py.topics.t01_basics.t01_variables import counter_gauge, score_history_figure
+from aplab_py.topics.t01_basics.t03_operations import value_history_figure
+
+HISTORY = list(range(0, 300, 3))
+
+
+def legacy_counter_gauge(value):
+    """The go.Figure gauge counter_gauge replaced, for comparison"""
+    return go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=value,
+        title={'text': "Counter Variable Value"},
+        gauge={
+            'axis': {'range': [-10, 10]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [-10, 0], 'color': "lightgray"},
+                {'range': [0, 10], 'color': "lightblue"}
+            ],
+        }
+    ))
+
+
+def legacy_score_history_figure(history):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(y=history, mode='lines+markers', name='Score'))
+    fig.update_layout(title='Score History', yaxis_title='Score Value', xaxis_title='Actions')
+    return fig
+
+
+def legacy_value_history_figure(history):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=list(range(len(history))), y=history,
+                             mode='lines+markers', name='Value History'))
+    fig.update_layout(title='Value Changes Over Operations', xaxis_title='Operation Number',
+                      yaxis_title='Value', height=400)
+    return fig
+
+
+CHARTS = {
+    "counter_gauge": (counter_gauge, legacy_counter_gauge, 7),
+    "score_history": (score_history_figure, legacy_score_history_figure, HISTORY),
+    "value_history": (value_history_figure, legacy_value_history_figure, HISTORY),
+}
+
+
+def measure_legacy(build, data, repeats: int) -> dict:
+    """go.Figure, then serialised as st.plotly_chart does"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        spec = pio.to_json(build(data), validate=False)
+    return {"ms": (time.perf_counter() - start) / repeats * 1000, "bytes": len(spec)}
+
+
+def measure_spec(build, data, repeats: int) -> dict:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        spec = build(data).to_cached().spec
+    return {"ms": (time.perf_counter() - start) / repeats * 1000, "bytes": len(spec)}
+
+
+def add_arguments(parser):
+    parser.add_argument("--repeats", type=int, default=200)
+    parser.add_argument("--json", dest="json_path", help="also write the results to this file")
+
+
+def run(args) -> int:
+    results = []
+    print(f"{'chart':<15} {'figure ms':>10} {'spec ms':>8} {'speedup':>8} "
+          f"{'figure B':>9} {'spec B':>7}  valid")
+    for name, (build, legacy, data) in CHARTS.items():
+        # Fill plotly's validator caches and check the spec on the way
+        error = None
+        try:
+            build(data).validate()
+        except ValueError as e:
+            error = str(e).splitlines()[0]
+        measure_legacy(legacy, data, 1)
+
+        figure = measure_legacy(legacy, data, args.repeats)
+        spec = measure_spec(build, data, args.repeats)
+        results.append({"chart": name, "figure": figure, "spec": spec, "error": error})
+        print(f"{name:<15} {figure['ms']:>10.3f} {spec['ms']:>8.3f} "
+              f"{figure['ms'] / spec['ms']:>7.1f}x {figure['bytes']:>9} {spec['bytes']:>7}  "
+              f"{error or 'ok'}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0 if all(result["error"] is None for result in results) else 1
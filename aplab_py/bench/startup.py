@@ -0,0 +1,146 @@
+# aplab_py/bench/startup.py
+
+"""Import-time tree of aplab_py.app and every topic in TOPICS"""
+
+import json
+import platform
+import re
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+# Imports the app first, then the topics in sidebar order, so each topic's
+# cumulative time is what it adds on top of the app
+PROBE = """
+import json
+import aplab_py.app as app
+paths = [path for category in app.TOPICS.values() for path in category.values()]
+print(json.dumps(paths))
+for path in paths:
+    __import__(path)
+"""
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# Modules we report on by name, besides the topics themselves
+WATCHED = [
+    "aplab_py.app",
+    "aplab_py.components.code_editor",
+    "aplab_py.components.visualizations",
+    "aplab_py.config.styles",
+    "streamlit",
+    "pandas",
+    "numpy",
+    "plotly.graph_objects",
+]
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Turn `-X importtime` output into a tree of {name, self_us, cumulative_us, children}.
+
+    Python prints a module after everything it imported, indented two
+    spaces per nesting level, so children always precede their parent.
+    """
+    pending: Dict[int, List[Dict]] = {}
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = len(indent) // 2
+        node = {
+            "name": name,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            "children": pending.pop(depth + 1, []),
+        }
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def flatten(tree: List[Dict], parent: Optional[str] = None, out: Optional[Dict] = None) -> Dict:
+    out = {} if out is None else out
+    for node in tree:
+        out[node["name"]] = {
+            "self_us": node["self_us"],
+            "cumulative_us": node["cumulative_us"],
+            "parent": parent,
+        }
+        flatten(node["children"], node["name"], out)
+    return out
+
+
+def profile() -> Dict:
+    """Run the probe in a clean interpreter and collect the timings"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        capture_output=True, text=True, check=True
+    )
+    topics = json.loads(result.stdout.strip().splitlines()[-1])
+    tree = parse_importtime(result.stderr)
+    modules = flatten(tree)
+    return {
+        "python": platform.python_version(),
+        "total_us": sum(node["cumulative_us"] for node in tree),
+        "topics": topics,
+        "watched": {
+            name: modules[name]
+            for name in WATCHED + topics
+            if name in modules
+        },
+        "modules": modules,
+        "tree": tree,
+    }
+
+
+def print_tree(nodes: List[Dict], min_us: int, max_depth: int, depth: int = 0):
+    for node in sorted(nodes, key=lambda n: n["cumulative_us"], reverse=True):
+        if node["cumulative_us"] < min_us:
+            continue
+        print(f"{node['self_us'] / 1000:9.1f} {node['cumulative_us'] / 1000:9.1f}  "
+              f"{'  ' * depth}{node['name']}")
+        if depth + 1 < max_depth:
+            print_tree(node["children"], min_us, max_depth, depth + 1)
+
+
+def print_comparison(report: Dict, baseline: Dict):
+    print(f"\n{'module':<58} {'before':>9} {'after':>9} {'delta':>9}  (cumulative ms)")
+    names = list(report["watched"]) + [
+        name for name in baseline.get("watched", {}) if name not in report["watched"]
+    ]
+    for name in names:
+        before = baseline.get("watched", {}).get(name, {}).get("cumulative_us", 0) / 1000
+        after = report["watched"].get(name, {}).get("cumulative_us", 0) / 1000
+        print(f"{name:<58} {before:9.1f} {after:9.1f} {after - before:+9.1f}")
+    before = baseline["total_us"] / 1000
+    after = report["total_us"] / 1000
+    print(f"{'total':<58} {before:9.1f} {after:9.1f} {after - before:+9.1f}")
+
+
+def add_arguments(parser):
+    parser.add_argument("--json", dest="json_path", help="write the full report to this file")
+    parser.add_argument("--compare", help="a report written by an earlier --json run")
+    parser.add_argument("--min-ms", type=float, default=5.0,
+                        help="hide modules whose cumulative time is below this")
+    parser.add_argument("--depth", type=int, default=3, help="tree depth to print")
+
+
+def run(args) -> int:
+    report = profile()
+
+    print(f"{'self ms':>9} {'cum ms':>9}  module")
+    print_tree(report["tree"], int(args.min_ms * 1000), args.depth)
+
+    print(f"\n{'module':<58} {'self ms':>9} {'cum ms':>9}")
+    for name, timing in report["watched"].items():
+        print(f"{name:<58} {timing['self_us'] / 1000:9.1f} {timing['cumulative_us'] / 1000:9.1f}")
+    print(f"{'total':<58} {'':>9} {report['total_us'] / 1000:9.1f}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(report, json.load(f))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
@@ -0,0 +1,49 @@
+# aplab_py/build.py
+
+"""Build-time steps: `python -m aplab_py.build`"""
+
+import logging
+
+from aplab_py.content import store
+from aplab_py.i18n import catalogs
+from aplab_py.search import index as search_index
+from aplab_py.topics import discovery
+
+
+def build_topic_manifest():
+    manifest = discovery.build_manifest()
+    count = sum(len(category["topics"]) for category in manifest["categories"])
+    return f"{count} topics -> {discovery.MANIFEST_PATH}"
+
+
+def build_translation_catalogs():
+    written = catalogs.build_catalogs()
+    return f"{len(written)} locales -> {catalogs.COMPILED_DIR}"
+
+
+def build_content_bundles():
+    count = store.build_content()
+    return f"{count} blocks -> {store.COMPILED_DIR}"
+
+
+def build_search_index():
+    size = search_index.build_index()
+    return f"{size} bytes -> {search_index.INDEX_PATH}"
+
+
+STEPS = [
+    ("topic manifest", build_topic_manifest),
+    ("translation catalogs", build_translation_catalogs),
+    ("lesson content", build_content_bundles),
+    ("search index", build_search_index),
+]
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    for name, step in STEPS:
+        logging.info("%s: %s", name, step())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# aplab_py/components/admin.py
+
+"""Operator page of a server process: `?admin=<APLAB_ADMIN_TOKEN>`.
+
+Shows what the sessions of this process hold in `st.session_state`, by
+topic namespace and by key (see aplab_py.state.accounting), and the
+shared figure cache. Each worker of `python -m aplab_py.serve` has its
+own sessions, so the page covers the worker the browser is pinned to.
+"""
+
+import hmac
+from typing import Dict
+
+import streamlit as st
+
+from aplab_py.components.figure_cache import figure_cache
+from aplab_py.config.setting import ADMIN_TOKEN
+from aplab_py.state import persistence
+from aplab_py.state.accounting import accounts
+
+ADMIN_PARAM = "admin"
+# Rows in the largest keys table
+TOP_KEYS = 20
+
+
+def requested() -> bool:
+    """Whether the URL carries the admin token"""
+    token = st.query_params.get(ADMIN_PARAM)
+    # compare_digest only takes ASCII str, so compare the UTF-8 bytes
+    return bool(ADMIN_TOKEN and token) and hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+
+def _kib(size: int) -> str:
+    return f"{size / 1024:,.1f} KiB"
+
+
+def show():
+    st.title("APlab server")
+    usages = accounts.measure()
+    total = sum(usage.total for usage in usages)
+
+    cols = st.columns(4)
+    cols[0].metric("Sessions", len(usages))
+    cols[1].metric("Session state", _kib(total))
+    cols[2].metric("Budget", _kib(accounts.budget) if accounts.budget is not None else "none")
+    cols[3].metric("Spilled sessions", sum(usage.spilled_keys > 0 for usage in usages))
+    st.caption(
+        f"Spilled so far: {_kib(accounts.spilled_bytes)}, "
+        f"{accounts.unpicklable_keys} unpicklable keys kept in memory. Sessions idle for "
+        f"{accounts.idle_seconds:.0f}s or more are spilled while over budget."
+    )
+
+    st.subheader("By topic")
+    namespaces: Dict[str, Dict[str, int]] = {}
+    for usage in usages:
+        for namespace, size in usage.namespaces.items():
+            row = namespaces.setdefault(namespace, {"sessions": 0, "bytes": 0})
+            row["sessions"] += 1
+            row["bytes"] += size
+    st.dataframe(
+        [
+            {"namespace": namespace, "sessions": row["sessions"], "size": _kib(row["bytes"])}
+            for namespace, row in sorted(namespaces.items(), key=lambda item: -item[1]["bytes"])
+        ],
+        use_container_width=True
+    )
+
+    st.subheader("By session")
+    st.dataframe(
+        [
+            {
+                "session": usage.session_id[:8],
+                "idle": f"{usage.idle_seconds:.0f}s",
+                "size": _kib(usage.total),
+                "largest topic": max(usage.namespaces, key=usage.namespaces.get, default=""),
+                "spilled keys": usage.spilled_keys,
+            }
+            for usage in sorted(usages, key=lambda usage: -usage.total)
+        ],
+        use_container_width=True
+    )
+
+    st.subheader("Largest keys")
+    keys = [
+        (size, usage.session_id[:8], namespace, key)
+        for usage in usages
+        for key, (namespace, size) in usage.keys.items()
+    ]
+    st.dataframe(
+        [
+            {"session": session, "namespace": namespace, "key": key, "size": _kib(size)}
+            for size, session, namespace, key in sorted(keys, reverse=True)[:TOP_KEYS]
+        ],
+        use_container_width=True
+    )
+
+    st.subheader("Figure cache")
+    st.json(figure_cache.stats())
+
+    backend = persistence.backend()
+    if isinstance(backend, persistence.SQLiteBackend):
+        st.subheader("Learner state store")
+        st.json({
+            "path": backend.path,
+            "rows written": backend.written,
+            "saves coalesced": backend.coalesced,
+        })
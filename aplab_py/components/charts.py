@@ -0,0 +1,77 @@
+# aplab_py/components/charts.py
+
+import json
+import logging
+from typing import Union
+
+import streamlit as st
+
+from aplab_py.components.figure_cache import CachedFigure
+from aplab_py.components.figure_spec import FigureSpec
+from aplab_py.lazy import lazy_import
+
+pio = lazy_import("plotly.io")
+
+logger = logging.getLogger(__name__)
+
+# Streamlit's defaults for st.plotly_chart: full width, height from the
+# figure layout (plotly.js uses 450px when the layout has none)
+DEFAULT_HEIGHT = 450
+SELECTION_MODE = ("points", "box", "lasso")
+
+try:
+    from streamlit.elements.lib.form_utils import current_form_id
+    from streamlit.elements.lib.layout_utils import LayoutConfig
+    from streamlit.elements.lib.utils import compute_and_register_element_id
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart as PlotlyChartProto
+    _fast_path = True
+except ImportError:
+    _fast_path = False
+
+
+def _enqueue(figure: CachedFigure, key, theme):
+    """Send the cached JSON as st.plotly_chart would, without rebuilding it"""
+    dg = st._main
+    proto = PlotlyChartProto()
+    proto.theme = theme or ""
+    proto.form_id = current_form_id(dg)
+    proto.spec = figure.spec
+    proto.config = json.dumps({})
+    proto.id = compute_and_register_element_id(
+        "plotly_chart",
+        user_key=key,
+        key_as_main_identity=False,
+        dg=dg,
+        plotly_spec=proto.spec,
+        plotly_config=proto.config,
+        selection_mode=SELECTION_MODE,
+        is_selection_activated=False,
+        theme=theme,
+        width="stretch",
+        height="content",
+        alt=None,
+    )
+    layout_config = LayoutConfig(width="stretch", height=figure.height or DEFAULT_HEIGHT)
+    dg._enqueue("plotly_chart", proto, layout_config=layout_config)
+
+
+def plotly_chart(figure: Union[CachedFigure, FigureSpec], key=None, theme="streamlit"):
+    """Draw a figure from the figure cache, or a FigureSpec.
+
+    Streamlit's own st.plotly_chart validates and serialises the figure on
+    every call; this sends the cached JSON straight away. It relies on
+    Streamlit internals, so if those change it falls back to
+    st.plotly_chart (still skipping the figure construction). `theme` is
+    st.plotly_chart's: None for figures drawn in our own templates.
+    """
+    global _fast_path
+    if isinstance(figure, FigureSpec):
+        figure = figure.to_cached()
+    if _fast_path:
+        try:
+            _enqueue(figure, key, theme)
+            return
+        except (AttributeError, TypeError) as e:
+            logger.warning("Plotly fast path unavailable, using st.plotly_chart: %s", e)
+            _fast_path = False
+    st.plotly_chart(pio.from_json(figure.spec), key=key, theme=theme)
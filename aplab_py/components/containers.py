@@ -0,0 +1,57 @@
+# aplab_py/components/containers.py
+
+from typing import Callable, Dict, Optional
+
+import streamlit as st
+
+from aplab_py.routing import TAB_PARAM, slugify
+
+
+def lazy_tabs(tabs: Dict[str, Callable[[], None]], key: str) -> str:
+    """Tabs that only run the body of the selected tab.
+
+    `st.tabs` runs every tab body on each rerun and hides all but one in
+    the browser. Here the tab bar is a horizontal radio and only the
+    selected body is called, so page cost follows what is on screen.
+    The selected label is kept in `st.session_state[key]` and returned,
+    and mirrored to the `?tab=` query parameter so the view can be linked;
+    on a session's first run that parameter picks the initial tab.
+
+        lazy_tabs({
+            "➕ Arithmetic": arithmetic_tab,
+            "⚖️ Comparison": comparison_tab,
+        }, key="operations_tab")
+    """
+    labels = list(tabs)
+    if st.session_state.get(key) not in tabs:
+        linked = st.query_params.get(TAB_PARAM)
+        st.session_state[key] = next(
+            (label for label in labels if slugify(label) == linked),
+            labels[0]
+        )
+
+    selected = st.radio(
+        "Tabs",
+        labels,
+        horizontal=True,
+        label_visibility="collapsed",
+        key=key
+    )
+    st.query_params[TAB_PARAM] = slugify(selected)
+    tabs[selected]()
+    return selected
+
+
+def lazy_expander(label: str, body: Callable[[], None],
+                  expanded: bool = False, key: Optional[str] = None) -> bool:
+    """An expander whose body only runs while it is open.
+
+    A collapsed `st.expander` still runs its widgets and figures; this one
+    is a toggle that calls `body` inside a bordered container only when
+    switched on. Returns whether it is open.
+    """
+    is_open = st.toggle(label, value=expanded, key=key)
+    if is_open:
+        with st.container(border=True):
+            body()
+    return is_open
@@ -0,0 +1,10 @@
+# aplab_py/components/content.py
+
+import streamlit as st
+
+from aplab_py.content import store
+
+
+def markdown_block(block_id: str):
+    """Render a static lesson block from the content store by id"""
+    st.markdown(store.block(block_id).text)
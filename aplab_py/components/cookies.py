@@ -0,0 +1,31 @@
+# aplab_py/components/cookies.py
+
+"""Browser cookies, read from the session's first request and set from a script.
+
+Streamlit only reads cookies (`st.context.cookies`, as the browser sent
+them when the session opened); `set_cookie` writes one from a hidden
+component, whose frame shares the app's origin. The server sees it from
+the browser's next session on.
+"""
+
+import json
+from typing import Optional
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+
+def get_cookie(name: str) -> Optional[str]:
+    value = st.context.cookies.get(name)
+    # AppTest's stand-in client context answers with mocks
+    return value if isinstance(value, str) else None
+
+
+def set_cookie(name: str, value: str, max_age: int):
+    cookie = json.dumps(f"{name}={value}; path=/; max-age={max_age}; samesite=lax")
+    components.html(f"""
+        <script>
+            document.cookie = {cookie}
+                + (window.parent.location.protocol === "https:" ? "; secure" : "");
+        </script>
+    """, height=0)
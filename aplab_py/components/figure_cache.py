@@ -0,0 +1,121 @@
+# aplab_py/components/figure_cache.py
+
+import functools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional
+
+from aplab_py.config.setting import FIGURE_CACHE_MAX_BYTES
+from aplab_py.lazy import lazy_import
+
+pio = lazy_import("plotly.io")
+
+
+@dataclass(frozen=True)
+class CachedFigure:
+    """A figure serialised once, ready to be sent as is"""
+    spec: str
+    height: Optional[int] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.spec)
+
+
+class FigureCache:
+    """Process-wide LRU of serialised figures, bounded by total spec size.
+
+    Figures are keyed by the function that builds them and its arguments
+    (the widget values), so every session asking for the same inputs
+    gets the same JSON without building or serialising the figure again.
+    """
+
+    def __init__(self, max_bytes: int = FIGURE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, CachedFigure]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CachedFigure]:
+        with self._lock:
+            figure = self._entries.get(key)
+            if figure is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return figure
+
+    def put(self, key: Hashable, figure: CachedFigure):
+        if figure.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous.size
+            self._entries[key] = figure
+            self.size += figure.size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+figure_cache = FigureCache()
+
+
+def serialize(figure) -> CachedFigure:
+    """Serialise a plotly figure the way st.plotly_chart does"""
+    if hasattr(figure, "to_cached"):  # a FigureSpec
+        return figure.to_cached()
+    height = figure.layout.height
+    return CachedFigure(
+        spec=pio.to_json(figure, validate=False),
+        height=int(height) if height else None
+    )
+
+
+def cached_figure(func: Callable) -> Callable[..., CachedFigure]:
+    """Cache a figure-building function by its arguments.
+
+    The function must be pure: its arguments (hashable widget values)
+    fully determine the figure, a go.Figure or a FigureSpec. It returns a `CachedFigure` to be drawn
+    with `aplab_py.components.charts.plotly_chart`.
+
+        @cached_figure
+        def number_line_figure(start: float, end: float):
+            fig = go.Figure()
+            ...
+            return fig
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> CachedFigure:
+        key = (name, args, tuple(sorted(kwargs.items())))
+        figure = figure_cache.get(key)
+        if figure is None:
+            figure = serialize(func(*args, **kwargs))
+            figure_cache.put(key, figure)
+        return figure
+
+    return wrapper
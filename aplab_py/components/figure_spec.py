@@ -0,0 +1,87 @@
+# aplab_py/components/figure_spec.py
+
+"""Plotly figures written straight as JSON-ready dicts.
+
+`go.Figure`, `add_trace` and `update_layout` run plotly's property
+validators on every call, which costs more than everything else a
+simple chart does. A `FigureSpec` skips them: traces and layout are
+plain dicts in plotly's JSON schema (nested dicts, no magic
+underscores), serialised with `json`:
+
+    spec = FigureSpec(title={'text': 'Score History'})
+    spec.add_trace('scatter', y=scores, mode='lines+markers')
+    plotly_chart(spec, theme=None)
+
+Nothing checks the property names, so a typo is silently ignored by
+plotly.js. Set FIGURE_SPEC_VALIDATE in config/setting.py while working
+on a chart to build every spec through `go.Figure` as well.
+"""
+
+import json
+from typing import List, Optional
+
+from aplab_py.components.figure_cache import CachedFigure
+from aplab_py.components.theme import BASE, template_spec
+from aplab_py.config import setting
+from aplab_py.lazy import lazy_import
+
+go = lazy_import("plotly.graph_objects")
+
+
+def _merge(target: dict, props: dict):
+    for name, value in props.items():
+        current = target.get(name)
+        if isinstance(value, dict) and isinstance(current, dict):
+            _merge(current, value)
+        else:
+            target[name] = value
+
+
+class FigureSpec:
+    """A figure as plain dicts, drawn with the compiled template `template`"""
+
+    __slots__ = ("data", "layout", "frames", "template")
+
+    def __init__(self, template: Optional[str] = BASE, **layout):
+        self.data: List[dict] = []
+        self.layout = layout
+        self.frames: List[dict] = []
+        self.template = template
+
+    def add_trace(self, type: str, **props) -> "FigureSpec":
+        props["type"] = type
+        self.data.append(props)
+        return self
+
+    def add_frame(self, name: str, data: List[dict], **props) -> "FigureSpec":
+        """An animation frame: `data` updates the traces, in order"""
+        self.frames.append(dict(props, name=name, data=data))
+        return self
+
+    def update_layout(self, **props) -> "FigureSpec":
+        """Merge `props` into the layout, nested dicts included"""
+        _merge(self.layout, props)
+        return self
+
+    def to_dict(self) -> dict:
+        layout = self.layout
+        if self.template is not None:
+            layout = dict(layout, template=template_spec(self.template))
+        figure = {"data": self.data, "layout": layout}
+        if self.frames:
+            figure["frames"] = self.frames
+        return figure
+
+    def validate(self):
+        """Build the spec as a go.Figure, raising ValueError on a bad property"""
+        return go.Figure(self.to_dict())
+
+    def to_cached(self) -> CachedFigure:
+        """Serialise for aplab_py.components.charts.plotly_chart"""
+        if setting.FIGURE_SPEC_VALIDATE:
+            self.validate()
+        height = self.layout.get("height")
+        return CachedFigure(
+            spec=json.dumps(self.to_dict(), separators=(",", ":")),
+            height=int(height) if height else None
+        )
@@ -0,0 +1,48 @@
+# aplab_py/components/sections.py
+
+import functools
+
+import streamlit as st
+
+from aplab_py.config.setting import SECTION_FRAGMENTS
+from aplab_py.state import topic_state
+from aplab_py.state.accounting import accounts
+
+
+def section(func=None, *, run_every=None):
+    """Declare an interactive part of a topic page as its own rerun unit.
+
+    A section runs as a Streamlit fragment: when one of its own widgets
+    changes, only the section reruns instead of the whole `show()`.
+    Sections are module-level functions without arguments, and must only
+    draw into the container they are called in (no `st.sidebar`).
+
+        @section
+        def number_line():
+            bounds = st.slider("Select range:", -10.0, 10.0, (-5.0, 5.0))
+            ...
+    """
+    def decorate(f):
+        if not SECTION_FRAGMENTS:
+            return f
+
+        # A section rerun on its own is still the learner at work on its
+        # topic, and the keys it adds belong to the topic on screen
+        @functools.wraps(f)
+        def accounted():
+            accounts.touch()
+            topic_state.touch(f.__module__)
+            with accounts.namespace():
+                return f()
+
+        return st.fragment(accounted, run_every=run_every)
+
+    return decorate(func) if func is not None else decorate
+
+
+def rerun_section():
+    """Rerun only the section this is called from"""
+    if SECTION_FRAGMENTS:
+        st.rerun(scope="fragment")
+    else:
+        st.rerun()
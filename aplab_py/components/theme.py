@@ -0,0 +1,105 @@
+# aplab_py/components/theme.py
+
+"""Plotly templates compiled from config/styles.py.
+
+The styles are turned into plotly templates once, validated and
+registered with plotly.io, instead of being spelled out (and validated
+again) in every figure's layout. Figures pick a template by name:
+
+    fig = go.Figure(layout=dict(template=template(DIAGRAM)))
+    st.plotly_chart(fig, theme=None)
+
+Draw them with `theme=None`: the template is the whole look, and the
+figure's JSON then carries it in place of Streamlit's much larger one.
+"""
+
+import threading
+
+from aplab_py.config.styles import CHART_STYLES, COLORS, TEXT_STYLES
+from aplab_py.lazy import lazy_import
+
+go = lazy_import("plotly.graph_objects")
+pio = lazy_import("plotly.io")
+
+BASE = "aplab"
+DIAGRAM = "aplab_diagram"
+
+_lock = threading.Lock()
+_registered = False
+_specs = {}
+
+
+def _base():
+    return go.layout.Template(
+        layout=dict(
+            font=TEXT_STYLES['body'],
+            title_font=TEXT_STYLES['header'],
+            colorway=CHART_STYLES['node_colors'],
+            paper_bgcolor=CHART_STYLES['background'],
+            plot_bgcolor=CHART_STYLES['background'],
+            xaxis=dict(gridcolor=COLORS['background']['light']),
+            yaxis=dict(gridcolor=COLORS['background']['light']),
+            annotationdefaults=dict(
+                arrowcolor=CHART_STYLES['arrow_color'],
+                arrowhead=2,
+                arrowsize=1.5,
+                arrowwidth=2
+            )
+        ),
+        data=dict(
+            bar=[go.Bar(marker_color=COLORS['primary']['blue'])]
+        )
+    )
+
+
+def _diagram(base):
+    """Nodes and arrows on hidden axes, as drawn by create_flow_chart"""
+    hidden = dict(showgrid=False, zeroline=False, showticklabels=False)
+    diagram = go.layout.Template(base)
+    diagram.update(
+        layout=dict(
+            showlegend=False,
+            xaxis=hidden,
+            yaxis=hidden,
+            height=200,
+            margin=dict(l=20, r=20, t=20, b=20)
+        ),
+        data=dict(
+            scatter=[go.Scatter(
+                mode='markers+text',
+                marker=dict(
+                    size=40,
+                    line=dict(color=CHART_STYLES['border_color'], width=2)
+                ),
+                textposition='middle center',
+                textfont=TEXT_STYLES['body']
+            )]
+        )
+    )
+    return diagram
+
+
+def register():
+    """Compile the templates and register them with plotly.io (once)"""
+    global _registered
+    with _lock:
+        if not _registered:
+            base = _base()
+            pio.templates[BASE] = base
+            pio.templates[DIAGRAM] = _diagram(base)
+            _registered = True
+
+
+def template(name: str = BASE) -> str:
+    """Name of a compiled template, registering them on first use"""
+    if not _registered:
+        register()
+    return name
+
+
+def template_spec(name: str = BASE) -> dict:
+    """A compiled template as plain JSON-ready dicts, for FigureSpec"""
+    spec = _specs.get(name)
+    if spec is None:
+        spec = _specs[name] = pio.templates[template(name)].to_plotly_json()
+    return spec
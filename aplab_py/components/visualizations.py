@@ -1,72 +1,137 @@
-import plotly.graph_objects as go
+from aplab_py.components.theme import DIAGRAM, template
+from aplab_py.config.styles import CHART_STYLES
+from aplab_py.lazy import lazy_import
 
-from aplab_py.config.styles import CHART_STYLES, TEXT_STYLES
+go = lazy_import("plotly.graph_objects")
+np = lazy_import("numpy")
 
 
 def create_flow_chart(nodes, x_positions=None):
-    """Create a flow chart with consistent styling"""
+    """Create a flow chart in the diagram template (draw with theme=None)"""
     if x_positions is None:
         x_positions = list(range(len(nodes)))
 
-    fig = go.Figure()
-
-    # Add nodes
-    fig.add_trace(go.Scatter(
-        x=x_positions,
-        y=[0] * len(nodes),
-        mode='markers+text',
-        marker=dict(
-            size=40,
-            color=CHART_STYLES['node_colors'][:len(nodes)],
-            line=dict(color=CHART_STYLES['border_color'], width=2)
+    # Arrow style comes from the template's annotation defaults
+    arrows = [
+        dict(x=x+0.5, y=0, ax=x, ay=0, xref='x', yref='y', axref='x', ayref='y',
+             text='', showarrow=True)
+        for x in x_positions[:-1]
+    ]
+
+    return go.Figure(
+        go.Scatter(
+            x=x_positions,
+            y=[0] * len(nodes),
+            marker_color=CHART_STYLES['node_colors'][:len(nodes)],
+            text=nodes
         ),
-        text=nodes,
-        textposition='middle center',
-        textfont=dict(
-            size=TEXT_STYLES['body']['size'],
-            color=TEXT_STYLES['body']['color'],
-            family=TEXT_STYLES['body']['family']
-        )
-    ))
-
-    # Add arrows
-    for i in range(len(nodes)-1):
-        fig.add_annotation(
-            x=x_positions[i]+0.5,
-            y=0,
-            ax=x_positions[i],
-            ay=0,
-            xref='x',
-            yref='y',
-            axref='x',
-            ayref='y',
-            text='',
-            showarrow=True,
-            arrowhead=2,
-            arrowsize=1.5,
-            arrowwidth=2,
-            arrowcolor=CHART_STYLES['arrow_color']
+        layout=dict(
+            template=template(DIAGRAM),
+            annotations=arrows,
+            xaxis_range=[min(x_positions)-0.5, max(x_positions)+0.5],
+            yaxis_range=[-0.5, 0.5]
         )
+    )
+
+
+# Container renderers: a fixed number of traces whatever the size of the
+# container, with all boxes and labels of one kind in a single trace built
+# from flat arrays. Per-element traces and shapes make plotly's layout
+# time grow faster than the element count.
+
+def _boxes(x_centers, y_centers, half_width, half_height, line_color, fill_color):
+    """One trace drawing a filled rectangle around every center"""
+    x_centers = np.asarray(x_centers, dtype=float)
+    y_centers = np.asarray(y_centers, dtype=float)
+    # Corners of each box, closed, then a gap (NaN) before the next one
+    dx = np.array([-1, 1, 1, -1, -1, np.nan]) * half_width
+    dy = np.array([-1, -1, 1, 1, -1, np.nan]) * half_height
+    return go.Scatter(
+        x=(x_centers[:, None] + dx).ravel(),
+        y=(y_centers[:, None] + dy).ravel(),
+        mode='lines',
+        fill='toself',
+        fillcolor=fill_color,
+        line=dict(color=line_color),
+        hoverinfo='skip',
+        showlegend=False
+    )
+
+
+def _labels(x, y, text, size=None, position='middle center'):
+    return go.Scatter(
+        x=x,
+        y=y,
+        mode='text',
+        text=text,
+        textposition=position,
+        textfont=dict(size=size) if size else None,
+        showlegend=False
+    )
+
 
-    # Update layout
+def sequence_figure(items, title='List Items and Their Indices'):
+    """Boxed items with their indices underneath, in three traces"""
+    positions = np.arange(len(items))
+    fig = go.Figure([
+        _boxes(positions, np.zeros(len(items)), 0.4, 0.4, "RoyalBlue", "LightSkyBlue"),
+        _labels(positions, np.zeros(len(items)), [str(item) for item in items]),
+        _labels(positions, np.full(len(items), -0.6), [f"Index: {i}" for i in positions],
+                position='top center'),
+    ])
     fig.update_layout(
-        showlegend=False,
+        title=title,
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False),
+        height=200,
+        margin=dict(l=20, r=20, t=40, b=20),
+        showlegend=False
+    )
+    return fig
+
+
+def mapping_figure(mapping, format_value=str, title='Dictionary Key-Value Pairs'):
+    """Key and value boxes, one row per pair, in three traces"""
+    rows = np.arange(len(mapping))
+    keys = [str(key) for key in mapping]
+    values = [format_value(value) for value in mapping.values()]
+    fig = go.Figure([
+        _boxes(np.full(len(rows), 0.5), rows, 0.5, 0.4, "RoyalBlue", "LightSkyBlue"),
+        _boxes(np.full(len(rows), 1.5), rows, 0.5, 0.4, "Green", "LightGreen"),
+        # Keys and values interleaved in one trace
+        _labels(np.tile([0.5, 1.5], len(rows)), np.repeat(rows, 2),
+                [text for pair in zip(keys, values) for text in pair]),
+    ])
+    fig.update_layout(
+        title=title,
         xaxis=dict(
-            showgrid=False,
-            zeroline=False,
-            showticklabels=False,
-            range=[min(x_positions)-0.5, max(x_positions)+0.5]
+            ticktext=['Keys', 'Values'],
+            tickvals=[0.5, 1.5],
+            range=[-0.5, 2.5]
         ),
+        yaxis=dict(visible=False),
+        height=50 + 50*len(mapping),
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    return fig
+
+
+def string_figure(text, title='String Characters and Their Positions (Index)'):
+    """Characters with their indices underneath, in two traces"""
+    positions = np.arange(len(text))
+    fig = go.Figure([
+        _labels(positions, np.ones(len(text)), list(text), size=20),
+        _labels(positions, np.zeros(len(text)), [str(i) for i in positions], size=14),
+    ])
+    fig.update_layout(
+        title=title,
+        showlegend=False,
         yaxis=dict(
-            showgrid=False,
-            zeroline=False,
-            showticklabels=False,
-            range=[-0.5, 0.5]
+            visible=False,
+            range=[-0.5, 1.5]
         ),
-        plot_bgcolor=CHART_STYLES['background'],
-        paper_bgcolor=CHART_STYLES['background'],
+        xaxis=dict(visible=False),
         height=200,
-        margin=dict(l=20, r=20, t=20, b=20)
+        margin=dict(l=20, r=20, t=40, b=20)
     )
-
-    return fig
\ No newline at end of file
+    return fig
@@ -0,0 +1,72 @@
+# aplab_py/config/setting.py
+
+import os
+
+# Topic import warm-up
+IMPORT_BUDGET_SECONDS = 2.0
+IMPORT_BUDGET_OVERRIDES = {
+    # Heavy libraries imported by the warm-up after the topics
+    "pandas": 5.0,
+    "plotly.graph_objects": 5.0,
+    # The fundamentals page pulls in the code editor and flow chart helpers
+    "aplab_py.topics.t00_fundamentals.t01_programming_basics": 3.0,
+}
+
+# Run topic sections as Streamlit fragments; turn off to rerun whole pages
+# while debugging
+SECTION_FRAGMENTS = True
+
+# `python -m aplab_py.bench coldstart` fails above this: importing
+# aplab_py.app plus the default topic in a fresh interpreter
+COLD_START_BUDGET_SECONDS = 1.5
+COLD_START_REPEATS = 5
+
+# `python -m aplab_py.serve`: pre-forked Streamlit workers behind a sticky
+# TCP front. Workers listen on consecutive ports from SERVE_WORKER_BASE_PORT
+SERVE_PORT = 8501
+SERVE_WORKER_BASE_PORT = 8600
+SERVE_WORKERS = None  # None: one per CPU core
+# A worker (or the front) that exits is started again after this long
+SERVE_RESTART_SECONDS = 1.0
+
+# Serialised figures kept by aplab_py.components.figure_cache, shared by all
+# sessions of a process; least recently used ones go first
+FIGURE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Build every aplab_py.components.figure_spec.FigureSpec through go.Figure
+# too, so a misspelt property raises instead of being ignored by plotly.js
+FIGURE_SPEC_VALIDATE = False
+
+# Processes for the algorithm race in the programming basics topic, shared
+# by all sessions of a server process; races queue up beyond this
+RACE_WORKERS = 2
+RACE_SIZES = [100, 250, 500, 1000, 2000]
+RACE_POLL_SECONDS = 0.5
+
+# aplab_py.state.bounded: values kept by session histories (score, value
+# history) and items kept by session lists and dicts (carts, catalogs)
+HISTORY_CAPACITY = 200
+COLLECTION_CAPACITY = 50
+
+# aplab_py.state.accounting: when the session state of a server process adds
+# up to more than the budget, the topic state of sessions idle for at least
+# SESSION_IDLE_SECONDS is spilled to disk, longest idle first (None: only
+# measure). Values under SESSION_SPILL_MIN_BYTES stay in memory.
+SESSION_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+SESSION_IDLE_SECONDS = 10 * 60
+SESSION_ACCOUNTING_SECONDS = 30
+SESSION_SPILL_MIN_BYTES = 1024
+SESSION_SPILL_DIR = None  # None: a new directory under the system temp dir
+
+# `?admin=<token>` shows session memory and cache statistics; no token, no page
+ADMIN_TOKEN = os.environ.get("APLAB_ADMIN_TOKEN")
+
+# aplab_py.state.persistence: learners' topic state is kept in this SQLite
+# file across sessions, restarts and workers of a machine (None: sessions only)
+SESSION_STORE_PATH = os.environ.get("APLAB_SESSION_DB")
+SESSION_STORE_FLUSH_SECONDS = 2.0
+SESSION_STORE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+# aplab_py.state.topic_state: the state of a topic not shown for this long is
+# unloaded by its policy (defaults kept, values dropped)
+TOPIC_UNLOAD_SECONDS = 20 * 60
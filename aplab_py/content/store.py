@@ -0,0 +1,125 @@
+# aplab_py/content/store.py
+
+"""Static lesson text, referred to by id.
+
+Long static markdown lives in `blocks/<topic id>/<name>.md` instead of
+string literals in the topic modules; a block's id is
+`"<topic id>/<name>"`, e.g. `"variables/what-is-a-variable"`.
+
+`build_content()` (part of `python -m aplab_py.build`) bundles each
+topic's blocks into `compiled/<topic id>.marshal` together with a
+content hash per block. `block()` loads a topic's bundle the first time
+one of its blocks is asked for and keeps it, read-only, for every
+session of the process.
+"""
+
+import hashlib
+import logging
+import marshal
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping
+
+logger = logging.getLogger(__name__)
+
+CONTENT_DIR = Path(__file__).resolve().parent
+BLOCKS_DIR = CONTENT_DIR / "blocks"
+COMPILED_DIR = CONTENT_DIR / "compiled"
+BUNDLE_VERSION = 1
+
+_lock = threading.Lock()
+_bundles: Dict[str, Mapping[str, "Block"]] = {}
+
+
+@dataclass(frozen=True)
+class Block:
+    """One static markdown block"""
+    id: str
+    hash: str
+    text: str
+
+    @property
+    def version(self) -> str:
+        """Short content hash, changes whenever the text does"""
+        return self.hash[:12]
+
+
+def topic_ids(blocks_dir: Path = BLOCKS_DIR) -> List[str]:
+    return sorted(path.name for path in blocks_dir.iterdir() if path.is_dir())
+
+
+def source_signature(topic_id: str, blocks_dir: Path = BLOCKS_DIR) -> str:
+    """Stat-based hash of a topic's block files, cheap enough to check at startup"""
+    digest = hashlib.sha1()
+    for path in sorted((blocks_dir / topic_id).glob("*.md")):
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()
+
+
+def read_topic(topic_id: str, blocks_dir: Path = BLOCKS_DIR) -> Dict[str, Block]:
+    """Every block of a topic, read straight from the sources"""
+    blocks = {}
+    for path in sorted((blocks_dir / topic_id).glob("*.md")):
+        text = path.read_text(encoding="utf-8")
+        block_id = f"{topic_id}/{path.stem}"
+        blocks[block_id] = Block(
+            id=block_id,
+            hash=hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            text=text
+        )
+    return blocks
+
+
+def build_content(blocks_dir: Path = BLOCKS_DIR, compiled_dir: Path = COMPILED_DIR) -> int:
+    """Write one bundle per topic; returns the number of blocks"""
+    compiled_dir.mkdir(exist_ok=True)
+    count = 0
+    for topic_id in topic_ids(blocks_dir):
+        blocks = read_topic(topic_id, blocks_dir)
+        payload = (
+            BUNDLE_VERSION,
+            source_signature(topic_id, blocks_dir),
+            {block.id: (block.hash, block.text) for block in blocks.values()}
+        )
+        (compiled_dir / f"{topic_id}.marshal").write_bytes(marshal.dumps(payload))
+        count += len(blocks)
+    return count
+
+
+def _load(topic_id: str, blocks_dir: Path, compiled_dir: Path) -> Dict[str, Block]:
+    path = compiled_dir / f"{topic_id}.marshal"
+    try:
+        version, signature, entries = marshal.loads(path.read_bytes())
+    except (OSError, ValueError, EOFError, TypeError):
+        logger.info("No content bundle for %s, reading blocks", topic_id)
+        return read_topic(topic_id, blocks_dir)
+
+    if version != BUNDLE_VERSION or signature != source_signature(topic_id, blocks_dir):
+        logger.warning("Content bundle %s is stale, reading blocks", path)
+        return read_topic(topic_id, blocks_dir)
+    return {
+        block_id: Block(id=block_id, hash=block_hash, text=text)
+        for block_id, (block_hash, text) in entries.items()
+    }
+
+
+def topic_blocks(topic_id: str, blocks_dir: Path = BLOCKS_DIR,
+                 compiled_dir: Path = COMPILED_DIR) -> Mapping[str, Block]:
+    """Read-only blocks of one topic, loaded once per process"""
+    blocks = _bundles.get(topic_id)
+    if blocks is None:
+        with _lock:
+            blocks = _bundles.get(topic_id)
+            if blocks is None:
+                blocks = MappingProxyType(_load(topic_id, blocks_dir, compiled_dir))
+                _bundles[topic_id] = blocks
+    return blocks
+
+
+def block(block_id: str) -> Block:
+    """The block `"<topic id>/<name>"`; raises KeyError for unknown ids"""
+    topic_id, _, _ = block_id.partition("/")
+    return topic_blocks(topic_id)[block_id]
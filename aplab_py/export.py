@@ -0,0 +1,402 @@
+# aplab_py/export.py
+
+"""Static HTML export: `python -m aplab_py.export --out site`.
+
+Every topic in the manifest is run once per tab with Streamlit's AppTest
+in its default widget state, and the resulting element tree is written
+out as a standalone page: markdown, code, tables, alerts and Plotly
+figures. Widgets themselves are left out. Lazy expanders are switched on
+so their text is exported, as collapsed `<details>` blocks. Markdown and
+figures are drawn in the browser by marked and plotly.js from a CDN, so
+the pages can be served from any static file server.
+
+Topics are exported in parallel on a process pool. A page is only
+rebuilt when the hash of its sources (the topic module, the shared
+components, config and content blocks, and the library versions)
+differs from the one recorded in `export.json` in the output directory.
+"""
+
+import argparse
+import hashlib
+import html
+import importlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aplab_py.content import store
+from aplab_py.topics import discovery
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+EXPORT_MANIFEST = "export.json"
+# Sources a topic page may depend on besides its own module and blocks:
+# the whole package but the other topic modules (see shared_sources)
+SHARED_SOURCES = ("**/*.py", "i18n/locales/*.json")
+
+MARKED_URL = "https://cdn.jsdelivr.net/npm/marked@12/marked.min.js"
+PLOTLY_URL = "https://cdn.plot.ly/plotly-{version}.min.js"
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{title} - APlab</title>
+<style>{css}</style>
+<script src="{marked_url}"></script>
+<script src="{plotly_url}"></script>
+</head>
+<body>
+<nav><a href="index.html">APlab</a>{app_link}</nav>
+<main>
+{body}
+</main>
+<script>
+document.querySelectorAll('script[type="text/markdown"]').forEach(source => {{
+    const target = document.createElement('div');
+    target.className = source.dataset.class || 'markdown';
+    target.innerHTML = marked.parse(source.textContent);
+    source.replaceWith(target);
+}});
+document.querySelectorAll('script[data-chart]').forEach(source => {{
+    const spec = JSON.parse(source.textContent);
+    // The whole figure, so animation frames come along
+    Plotly.newPlot(source.dataset.chart, {{...spec, config: {{responsive: true}}}});
+}});
+</script>
+</body>
+</html>
+"""
+
+CSS = """
+body { font-family: Inter, Arial, sans-serif; margin: 0; color: #262730; }
+nav { padding: 12px 24px; border-bottom: 1px solid #eee; display: flex; gap: 24px; }
+nav a { color: #2196F3; text-decoration: none; font-weight: 600; }
+main { max-width: 1100px; margin: 0 auto; padding: 24px; }
+pre { background: #f5f5f5; padding: 12px; border-radius: 6px; overflow-x: auto; }
+.columns { display: flex; gap: 16px; flex-wrap: wrap; }
+.columns > div { flex: 1 1 0; min-width: 220px; }
+.bordered { border: 1px solid #ddd; border-radius: 8px; padding: 12px; margin: 8px 0; }
+.alert { padding: 12px 16px; border-radius: 6px; margin: 8px 0; }
+.alert-info { background: #e8f1fb; } .alert-success { background: #e8f6ec; }
+.alert-warning { background: #fff8e1; } .alert-error { background: #fdecea; }
+.caption { color: #666; font-size: 0.9em; }
+.metric .label { color: #666; } .metric .value { font-size: 1.8em; }
+details { border: 1px solid #ddd; border-radius: 6px; padding: 8px 12px; margin: 8px 0; }
+summary { cursor: pointer; font-weight: 600; }
+table { border-collapse: collapse; } td, th { border: 1px solid #ddd; padding: 4px 8px; }
+.tabs > input { display: none; }
+.tabs > label { display: inline-block; padding: 8px 14px; cursor: pointer; border-bottom: 2px solid transparent; }
+.tabs > input:checked + label { border-bottom-color: #2196F3; font-weight: 600; }
+.tabs > .tab { display: none; padding-top: 12px; }
+"""
+
+# Renders the topic the way app.py does, without the sidebar
+SCRIPT = """
+import importlib
+importlib.import_module({module!r}).show()
+"""
+
+CHART_OPEN = '<div id="{id}"></div><script type="application/json" data-chart="{id}">'
+CHART_PLACEHOLDER = "chart-?"
+
+# The element tree does not carry the height components.html() was given
+IFRAME_HEIGHT = 420
+
+TABS_LABEL = "Tabs"
+ALERTS = {"info", "success", "warning", "error"}
+
+
+def shared_sources() -> List[Path]:
+    """Files matching SHARED_SOURCES, without the topic modules"""
+    paths = {path for pattern in SHARED_SOURCES for path in PACKAGE_DIR.glob(pattern)}
+    return sorted(
+        path for path in paths
+        if "__pycache__" not in path.parts
+        and not (path.parent.parent == discovery.TOPICS_DIR
+                 and discovery.TOPIC_FILE.match(path.name))
+    )
+
+
+def source_hash(topic: Dict) -> str:
+    """Hash of everything a topic page is rendered from"""
+    import plotly
+    import streamlit
+
+    digest = hashlib.sha256(f"{streamlit.__version__}:{plotly.__version__}".encode())
+    module_file = PACKAGE_DIR.parent / (topic["module"].replace(".", "/") + ".py")
+    paths = [module_file, *shared_sources()]
+    paths.extend(sorted((store.BLOCKS_DIR / topic["id"]).glob("*.md")))
+    for path in paths:
+        digest.update(str(path.relative_to(PACKAGE_DIR.parent)).encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class PageRenderer:
+    """Turns an AppTest element tree into HTML"""
+
+    def markdown(self, text: str, css_class: str = "markdown") -> str:
+        # Keep the text out of the HTML parser until marked renders it
+        text = text.replace("</", "<\\/")
+        return f'<script type="text/markdown" data-class="{css_class}">{text}</script>'
+
+    def children(self, node) -> List:
+        return [child for _, child in sorted(getattr(node, "children", {}).items())]
+
+    def render_all(self, nodes: List) -> List[str]:
+        parts = []
+        skip = False
+        for i, node in enumerate(nodes):
+            if skip:
+                skip = False
+                continue
+            following = nodes[i + 1] if i + 1 < len(nodes) else None
+            # lazy_expander: a toggle followed by the bordered container it opened
+            if (node.type == "toggle" and following is not None
+                    and following.type == "flex_container" and node.value):
+                inner = "".join(self.render_all(self.children(following)))
+                parts.append(f"<details><summary>{html.escape(node.label)}</summary>{inner}</details>")
+                skip = True
+                continue
+            parts.append(self.render(node))
+        return parts
+
+    def render(self, node) -> str:
+        kind = node.type
+        if kind in ("markdown", "title", "header", "subheader"):
+            return self.markdown(node.value)
+        if kind == "caption":
+            return self.markdown(node.value, "markdown caption")
+        if kind == "divider":
+            return "<hr>"
+        if kind in ALERTS:
+            return f'<div class="alert alert-{kind}">{self.markdown(node.value)}</div>'
+        if kind == "code":
+            language = html.escape(node.language or "")
+            return f'<pre><code class="language-{language}">{html.escape(node.value)}</code></pre>'
+        if kind == "json":
+            return f"<pre>{html.escape(node.value)}</pre>"
+        if kind in ("table", "dataframe"):
+            return node.value.to_html(border=0)
+        if kind == "metric":
+            delta = f'<div class="delta">{html.escape(node.delta)}</div>' if node.delta else ""
+            return (f'<div class="metric"><div class="label">{html.escape(node.label)}</div>'
+                    f'<div class="value">{html.escape(node.value)}</div>{delta}</div>')
+        if kind == "plotly_chart":
+            # Numbered once the page is assembled, so equal charts in
+            # different tab runs render to equal HTML
+            spec = node.proto.spec.replace("</", "<\\/")
+            return f"{CHART_OPEN.format(id=CHART_PLACEHOLDER)}{spec}</script>"
+        if kind == "iframe" and node.proto.srcdoc:
+            return (f'<iframe srcdoc="{html.escape(node.proto.srcdoc)}" height="{IFRAME_HEIGHT}" '
+                    f'style="width:100%;border:0"></iframe>')
+        if kind == "expander":
+            inner = "".join(self.render_all(self.children(node)))
+            return f"<details><summary>{html.escape(node.label)}</summary>{inner}</details>"
+        if kind == "flex_container":
+            children = self.children(node)
+            if children and all(child.type == "column" for child in children):
+                columns = "".join(
+                    f'<div style="flex-grow:{getattr(child, "weight", 1) or 1}">'
+                    f'{"".join(self.render_all(self.children(child)))}</div>'
+                    for child in children
+                )
+                return f'<div class="columns">{columns}</div>'
+            inner = "".join(self.render_all(children))
+            bordered = node.proto.flex_container.border if node.proto is not None else False
+            return f'<div class="bordered">{inner}</div>' if bordered else f"<div>{inner}</div>"
+        if kind in ("column", "tab"):
+            return "".join(self.render_all(self.children(node)))
+        # Input widgets and anything else without static content
+        return ""
+
+
+def _open_toggles(at, passes: int = 3):
+    """Switch on every toggle, including ones revealed by other toggles"""
+    for _ in range(passes):
+        closed = [toggle for toggle in at.toggle if not toggle.value]
+        if not closed:
+            return
+        for toggle in closed:
+            toggle.set_value(True)
+        at.run()
+
+
+def _main_nodes(at, renderer: PageRenderer) -> List:
+    if at.exception:
+        raise RuntimeError("; ".join(e.message for e in at.exception))
+    return renderer.children(at._tree.children[0])
+
+
+def render_topic(topic: Dict) -> str:
+    """Body HTML of one topic, every tab included"""
+    from streamlit.testing.v1 import AppTest
+
+    renderer = PageRenderer()
+    at = AppTest.from_string(SCRIPT.format(module=topic["module"]), default_timeout=120)
+    at.run()
+    _open_toggles(at)
+    tabs = [radio for radio in at.radio if radio.label == TABS_LABEL]
+    if not tabs:
+        return "".join(renderer.render_all(_main_nodes(at, renderer)))
+
+    # Render the page once per tab: the part before the tab bar and the
+    # tail after the tab body are the same in every run
+    nodes = _main_nodes(at, renderer)
+    split = next(i for i, node in enumerate(nodes) if node.type == "radio" and node.label == TABS_LABEL)
+    head = renderer.render_all(nodes[:split])
+    options = list(tabs[0].options)
+    bodies = []
+    for n, option in enumerate(options):
+        if n:
+            at.radio(key=tabs[0].key).set_value(option).run()
+            _open_toggles(at)
+        bodies.append(renderer.render_all(_main_nodes(at, renderer)[split + 1:]))
+
+    tail = 0
+    while (tail < min(len(body) for body in bodies)
+           and all(body[-1 - tail] == bodies[0][-1 - tail] for body in bodies)):
+        tail += 1
+    group = f"tabs-{topic['id']}"
+    tab_html = []
+    for n, (option, body) in enumerate(zip(options, bodies)):
+        checked = " checked" if n == 0 else ""
+        tab_html.append(
+            f'<input type="radio" name="{group}" id="{group}-{n}"{checked}>'
+            f'<label for="{group}-{n}">{html.escape(option)}</label>'
+        )
+    panels = "".join(
+        f'<div class="tab" id="{group}-panel-{n}">{"".join(body[:len(body) - tail])}</div>'
+        for n, body in enumerate(bodies)
+    )
+    # Pure CSS tab switching: show the panel whose radio is checked
+    switch = "".join(
+        f"#{group}-{n}:checked ~ #{group}-panel-{n} {{ display: block; }}"
+        for n in range(len(options))
+    )
+    return ("".join(head)
+            + f'<style>{switch}</style><div class="tabs">{"".join(tab_html)}{panels}</div>'
+            + "".join(bodies[0][len(bodies[0]) - tail:]))
+
+
+def _number_charts(body: str) -> str:
+    pieces = body.split(CHART_OPEN.format(id=CHART_PLACEHOLDER))
+    return pieces[0] + "".join(
+        CHART_OPEN.format(id=f"chart-{n}") + piece
+        for n, piece in enumerate(pieces[1:], start=1)
+    )
+
+
+def _page(title: str, body: str, app_link: str = "") -> str:
+    from plotly.offline import get_plotlyjs_version
+
+    return PAGE.format(
+        title=html.escape(title),
+        css=CSS,
+        marked_url=MARKED_URL,
+        plotly_url=PLOTLY_URL.format(version=get_plotlyjs_version()),
+        app_link=app_link,
+        body=_number_charts(body)
+    )
+
+
+def export_topic(topic: Dict, out_dir: str, app_url: Optional[str]) -> float:
+    """Write `<out_dir>/<topic id>.html`; runs in a pool worker"""
+    logging.disable(logging.WARNING)
+    start = time.perf_counter()
+    app_link = ""
+    if app_url:
+        href = html.escape(f"{app_url}?topic={topic['id']}")
+        app_link = f'<a href="{href}">Open the interactive version</a>'
+    page = _page(topic["title"], render_topic(topic), app_link)
+    Path(out_dir, f"{topic['id']}.html").write_text(page, encoding="utf-8")
+    return time.perf_counter() - start
+
+
+def write_index(manifest: Dict, out_dir: Path):
+    sections = []
+    for category in manifest["categories"]:
+        links = "".join(
+            f'<li><a href="{topic["id"]}.html">{html.escape(topic["title"])}</a></li>'
+            for topic in category["topics"]
+        )
+        sections.append(f"<h2>{html.escape(category['title'])}</h2><ul>{links}</ul>")
+    body = "<h1>APlab - Interactive Python Learning</h1>" + "".join(sections)
+    (out_dir / "index.html").write_text(_page("Topics", body), encoding="utf-8")
+
+
+def export_site(out_dir: Path, jobs: Optional[int] = None, force: bool = False,
+                app_url: Optional[str] = None) -> Dict[str, str]:
+    """Export every changed topic; returns {topic id: "built" | "unchanged" | error}"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest = discovery.load_manifest()
+    topics = [topic for category in manifest["categories"] for topic in category["topics"]]
+
+    manifest_path = out_dir / EXPORT_MANIFEST
+    try:
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = {}
+
+    hashes = {topic["id"]: source_hash(topic) for topic in topics}
+    status = {}
+    stale = []
+    for topic in topics:
+        page = out_dir / f"{topic['id']}.html"
+        if not force and previous.get(topic["id"]) == hashes[topic["id"]] and page.exists():
+            status[topic["id"]] = "unchanged"
+        else:
+            stale.append(topic)
+
+    # Submit the function by its module path: AppTest swaps out __main__
+    # in the workers, so `python -m` pickles of __main__ functions break
+    worker = importlib.import_module("aplab_py.export").export_topic
+    recorded = {topic_id: digest for topic_id, digest in previous.items() if topic_id in hashes}
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs or min(len(stale), os.cpu_count() or 1)) as pool:
+            futures = {
+                pool.submit(worker, topic, str(out_dir), app_url): topic
+                for topic in stale
+            }
+            for future in as_completed(futures):
+                topic = futures[future]
+                try:
+                    seconds = future.result()
+                except Exception as e:
+                    status[topic["id"]] = f"failed: {e}"
+                    recorded.pop(topic["id"], None)
+                    logger.error("%s: %s", topic["id"], e)
+                else:
+                    status[topic["id"]] = "built"
+                    recorded[topic["id"]] = hashes[topic["id"]]
+                    logger.info("%s: %.1fs", topic["id"], seconds)
+
+    write_index(manifest, out_dir)
+    manifest_path.write_text(json.dumps(recorded, indent=2) + "\n", encoding="utf-8")
+    return status
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m aplab_py.export", description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default="site", help="output directory")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: one per topic, up to the CPU count)")
+    parser.add_argument("--force", action="store_true", help="rebuild unchanged topics too")
+    parser.add_argument("--app-url", help="link each page to the interactive app at this URL")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    status = export_site(Path(args.out), args.jobs, args.force, args.app_url)
+    for topic_id, result in status.items():
+        print(f"{topic_id:<24} {result}")
+    return 1 if any(result.startswith("failed") for result in status.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,117 @@
+# aplab_py/i18n/catalogs.py
+
+"""Translation catalogs.
+
+Each locale has a message file `locales/<locale>.json`:
+
+    {"fallback": "en", "messages": {"app.title": "...", ...}}
+
+`build_catalogs()` (part of `python -m aplab_py.build`) resolves every
+fallback chain at build time and writes one flat table per locale to
+`compiled/<locale>.marshal`, so a lookup is a single dict access and a
+missing message already holds its fallback's text. `catalog()` loads a
+locale the first time a session asks for it and hands every session of
+the process the same read-only mapping; locales nobody asked for are
+never loaded.
+"""
+
+import hashlib
+import json
+import logging
+import marshal
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+I18N_DIR = Path(__file__).resolve().parent
+LOCALES_DIR = I18N_DIR / "locales"
+COMPILED_DIR = I18N_DIR / "compiled"
+CATALOG_VERSION = 1
+DEFAULT_LOCALE = "en"
+
+_lock = threading.Lock()
+_loaded: Dict[str, Mapping[str, str]] = {}
+
+
+def available_locales(locales_dir: Path = LOCALES_DIR) -> List[str]:
+    return sorted(path.stem for path in locales_dir.glob("*.json"))
+
+
+def _read_source(locale: str, locales_dir: Path) -> Dict:
+    return json.loads((locales_dir / f"{locale}.json").read_text(encoding="utf-8"))
+
+
+def fallback_chain(locale: str, locales_dir: Path = LOCALES_DIR) -> List[str]:
+    """`locale` followed by the locales it falls back to, nearest first"""
+    chain = []
+    current: Optional[str] = locale
+    while current is not None:
+        if current in chain:
+            raise ValueError(f"Fallback cycle in translations: {' -> '.join(chain + [current])}")
+        chain.append(current)
+        current = _read_source(current, locales_dir).get("fallback")
+    return chain
+
+
+def source_signature(locale: str, locales_dir: Path = LOCALES_DIR) -> str:
+    """Hash of the message files a compiled table was built from"""
+    digest = hashlib.sha1()
+    for name in fallback_chain(locale, locales_dir):
+        digest.update((locales_dir / f"{name}.json").read_bytes())
+    return digest.hexdigest()
+
+
+def compile_locale(locale: str, locales_dir: Path = LOCALES_DIR) -> Dict[str, str]:
+    """Flatten a locale and its fallbacks into one message table"""
+    messages: Dict[str, str] = {}
+    for name in reversed(fallback_chain(locale, locales_dir)):
+        messages.update(_read_source(name, locales_dir)["messages"])
+    return messages
+
+
+def build_catalogs(locales_dir: Path = LOCALES_DIR, compiled_dir: Path = COMPILED_DIR) -> List[Path]:
+    """Write `compiled/<locale>.marshal` for every locale"""
+    compiled_dir.mkdir(exist_ok=True)
+    written = []
+    for locale in available_locales(locales_dir):
+        path = compiled_dir / f"{locale}.marshal"
+        payload = (CATALOG_VERSION, source_signature(locale, locales_dir),
+                   compile_locale(locale, locales_dir))
+        path.write_bytes(marshal.dumps(payload))
+        written.append(path)
+    return written
+
+
+def _load(locale: str, locales_dir: Path, compiled_dir: Path) -> Dict[str, str]:
+    path = compiled_dir / f"{locale}.marshal"
+    try:
+        version, signature, messages = marshal.loads(path.read_bytes())
+    except (OSError, ValueError, EOFError, TypeError):
+        logger.info("No compiled catalog for %s, compiling in memory", locale)
+        return compile_locale(locale, locales_dir)
+
+    if version != CATALOG_VERSION or signature != source_signature(locale, locales_dir):
+        logger.warning("Compiled catalog %s is stale, compiling in memory", path)
+        return compile_locale(locale, locales_dir)
+    return messages
+
+
+def catalog(locale: str, locales_dir: Path = LOCALES_DIR,
+            compiled_dir: Path = COMPILED_DIR) -> Mapping[str, str]:
+    """Read-only messages for `locale`, or for DEFAULT_LOCALE if it is unknown"""
+    messages = _loaded.get(locale)
+    if messages is not None:
+        return messages
+
+    # `locale` usually comes from the URL, only accept ones we ship
+    if locale not in available_locales(locales_dir):
+        return catalog(DEFAULT_LOCALE, locales_dir, compiled_dir)
+    with _lock:
+        messages = _loaded.get(locale)
+        if messages is None:
+            messages = MappingProxyType(_load(locale, locales_dir, compiled_dir))
+            _loaded[locale] = messages
+    return messages
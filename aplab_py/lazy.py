@@ -0,0 +1,87 @@
+# aplab_py/lazy.py
+
+"""Deferred imports for heavy libraries.
+
+Topic and component modules bind pandas, numpy and plotly through
+`lazy_import` so importing them stays cheap; the real import happens on
+the first attribute access, i.e. when a section that uses the library
+actually runs.
+
+    go = lazy_import("plotly.graph_objects")
+    ...
+    fig = go.Figure()   # plotly is imported here
+"""
+
+import importlib
+import threading
+from typing import Dict, Iterable, Optional
+
+_lock = threading.Lock()
+_registry: Dict[str, "LazyModule"] = {}
+
+# Plotly looks numpy and pandas up in sys.modules instead of importing
+# them, so while another thread is still importing pandas it sees a
+# half-initialised module and fails validating figure data. Importing
+# them first waits for any import in progress.
+IMPORT_FIRST = {
+    "plotly.graph_objects": ("numpy", "pandas"),
+}
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access"""
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            # The import machinery serialises concurrent imports of the
+            # same module, so racing threads get the same object.
+            for name in IMPORT_FIRST.get(self._name, ()):
+                importlib.import_module(name)
+            module = self._module = importlib.import_module(self._name)
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a shared lazy proxy for the module `name`"""
+    with _lock:
+        module = _registry.get(name)
+        if module is None:
+            module = _registry[name] = LazyModule(name)
+        return module
+
+
+def preload(names: Optional[Iterable[str]] = None):
+    """Import deferred modules now (all registered ones by default)"""
+    with _lock:
+        modules = list(_registry.values()) if names is None else [
+            _registry[name] for name in names if name in _registry
+        ]
+    for module in modules:
+        module._load()
+
+
+def loaded() -> Dict[str, bool]:
+    """Which registered lazy modules have been imported so far"""
+    with _lock:
+        return {name: module.is_loaded for name, module in _registry.items()}
@@ -0,0 +1,164 @@
+# aplab_py/registry.py
+
+import importlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from aplab_py import lazy
+from aplab_py.config.setting import IMPORT_BUDGET_OVERRIDES, IMPORT_BUDGET_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImportTiming:
+    """Import result for a single topic module"""
+    module_path: str
+    seconds: float
+    budget: float
+    thread: str
+    error: Optional[str] = None
+
+    @property
+    def over_budget(self) -> bool:
+        return self.seconds > self.budget
+
+
+class TopicRegistry:
+    """Imports the modules listed in TOPICS ahead of learner requests.
+
+    `warm_up()` imports every registered module on a daemon thread, in
+    sidebar order, so the first learner to open a topic finds it in
+    `sys.modules`. The heavy libraries the topics bind through
+    `lazy_import` are imported next, on the same thread. `load()` is
+    safe to call while the warm-up is still running: Python's per-module
+    import lock makes it wait for the in-flight import instead of
+    importing twice.
+    """
+
+    def __init__(self, topics: Dict[str, Dict[str, str]],
+                 budget: float = IMPORT_BUDGET_SECONDS,
+                 overrides: Optional[Dict[str, float]] = None):
+        self.module_paths = [
+            module_path
+            for category in topics.values()
+            for module_path in category.values()
+        ]
+        self.budget = budget
+        self.overrides = IMPORT_BUDGET_OVERRIDES if overrides is None else overrides
+        self.timings: Dict[str, ImportTiming] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # Prefetches started and not finished yet, by module path
+        self._prefetching: Dict[str, threading.Thread] = {}
+
+    def budget_for(self, module_path: str) -> float:
+        return self.overrides.get(module_path, self.budget)
+
+    def warm_up(self) -> threading.Thread:
+        """Start importing every registered module in the background"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._warm_all,
+                    name="aplab-topic-warm-up",
+                    daemon=True
+                )
+                self._thread.start()
+        return self._thread
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the warm-up finished; returns False on timeout"""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def load(self, module_path: str):
+        """Return the topic module, importing it now if the warm-up has not"""
+        module = self._import(module_path)
+        if module is None:
+            # Re-raise the original error to the caller
+            return importlib.import_module(module_path)
+        return module
+
+    def prefetch(self, module_path: str) -> Optional[threading.Thread]:
+        """Import one module on a daemon thread unless it is already loaded.
+
+        Returns the thread importing it, None once it is loaded; reruns
+        and other sessions asking meanwhile get the same thread.
+        """
+        with self._lock:
+            if module_path in self.timings:
+                return None
+            thread = self._prefetching.get(module_path)
+            if thread is None:
+                thread = self._prefetching[module_path] = threading.Thread(
+                    target=self._prefetch,
+                    args=(module_path,),
+                    name="aplab-topic-prefetch",
+                    daemon=True
+                )
+                thread.start()
+        return thread
+
+    def _prefetch(self, module_path: str):
+        try:
+            self._import(module_path)
+        finally:
+            with self._lock:
+                del self._prefetching[module_path]
+
+    def _warm_all(self):
+        for module_path in self.module_paths:
+            self._import(module_path)
+        # Libraries deferred by lazy_import, now that no import of ours
+        # is on a learner's critical path any more
+        for module_path in lazy.loaded():
+            self._import(module_path)
+        slow = [t for t in self.timings.values() if t.over_budget]
+        logger.info(
+            "Warmed up %d modules (%d over budget)",
+            len(self.timings), len(slow)
+        )
+
+    def _import(self, module_path: str):
+        with self._lock:
+            timed = module_path in self.timings
+
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(module_path)
+            error = None
+        except Exception as e:
+            module = None
+            error = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+
+        # Only the call that actually paid for the import gets recorded;
+        # later calls are dictionary lookups in sys.modules.
+        if timed:
+            return module
+        with self._lock:
+            if module_path in self.timings:
+                return module
+            timing = ImportTiming(
+                module_path=module_path,
+                seconds=elapsed,
+                budget=self.budget_for(module_path),
+                thread=threading.current_thread().name,
+                error=error
+            )
+            self.timings[module_path] = timing
+
+        if error is not None:
+            logger.error("Failed to import %s: %s", module_path, error)
+        elif timing.over_budget:
+            logger.warning(
+                "Importing %s took %.2fs (budget %.2fs)",
+                module_path, timing.seconds, timing.budget
+            )
+        return module
@@ -0,0 +1,64 @@
+# aplab_py/routing.py
+
+"""URL routing: `?topic=<id>&tab=<slug>`.
+
+Topic ids are the manifest ids (the module name without its `tNN_`
+prefix, e.g. `operations`); tab slugs are the lazy_tabs labels reduced to
+lowercase words (`"⚖️ Comparison"` -> `comparison`). Both are resolved
+before the sidebar renders, so a deep link costs a single script run.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional
+
+TOPIC_PARAM = "topic"
+TAB_PARAM = "tab"
+# Learner ids used to be in the URL; app.py drops them from old links
+LEARNER_PARAM = "learner"
+
+
+@dataclass(frozen=True)
+class Route:
+    """A topic position in the curriculum"""
+    category: str
+    title: str
+    topic_id: str
+    module: str
+
+
+def slugify(label: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", label.lower()).strip("-")
+
+
+def curriculum(manifest: Dict) -> List[Route]:
+    """Every topic in sidebar order"""
+    return [
+        Route(category["title"], topic["title"], topic["id"], topic["module"])
+        for category in manifest["categories"]
+        for topic in category["topics"]
+    ]
+
+
+def resolve(manifest: Dict, params: Mapping[str, str]) -> Route:
+    """The route named by the query parameters, or the first topic"""
+    routes = curriculum(manifest)
+    topic_id = params.get(TOPIC_PARAM)
+    for route in routes:
+        if route.topic_id == topic_id:
+            return route
+    return routes[0]
+
+
+def find(manifest: Dict, module: str) -> Optional[Route]:
+    for route in curriculum(manifest):
+        if route.module == module:
+            return route
+    return None
+
+
+def next_route(manifest: Dict, route: Route) -> Optional[Route]:
+    """The topic after `route` in the curriculum, if any"""
+    routes = curriculum(manifest)
+    index = routes.index(route)
+    return routes[index + 1] if index + 1 < len(routes) else None
@@ -0,0 +1,270 @@
+# aplab_py/search/index.py
+
+"""Full-text topic search over a prebuilt, memory-mapped inverted index.
+
+`build_index()` (part of `python -m aplab_py.build`) reads every topic
+module with `ast` - the text of its markdown, headers, tab and expander
+labels and code snippets, plus the content-store blocks it renders - and
+writes `index.bin`:
+
+    header   magic, version, signature, section sizes
+    docs     JSON list of [topic id, title]
+    terms    one (text offset, text length, postings offset, postings
+             count, total frequency) record per term, sorted by term
+    text     the term strings, UTF-8, back to back
+    postings (doc, frequency) pairs, grouped by term
+
+`SearchIndex` maps the file and answers queries straight from the mapped
+pages with binary searches: the sorted term table doubles as a flattened
+trie, every term sharing a prefix sits in one contiguous run. Nothing is
+unpacked up front and no topic module is imported, and since the mapping
+is read-only every worker process shares the same page cache.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import mmap
+import re
+import struct
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from aplab_py.content import store
+from aplab_py.topics import discovery
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = Path(__file__).resolve().parent / "index.bin"
+INDEX_MAGIC = b"APLS"
+INDEX_VERSION = 1
+
+HEADER = struct.Struct("<4sI40sIII")
+TERM = struct.Struct("<IHIII")
+POSTING = struct.Struct("<HH")
+
+TOKEN = re.compile(r"\w{2,}")
+
+# Streamlit calls whose string arguments are lesson text
+TEXT_CALLS = {
+    "markdown", "header", "subheader", "title", "caption", "write", "text",
+    "code", "info", "success", "warning", "error", "expander", "toggle",
+    "lazy_expander",
+}
+# Terms in a topic's title count this many times over
+TITLE_WEIGHT = 10
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN.findall(text.lower())
+
+
+def _strings(node: ast.AST) -> List[str]:
+    """Literal text in an expression, including the fixed parts of f-strings"""
+    return [
+        child.value for child in ast.walk(node)
+        if isinstance(child, ast.Constant) and isinstance(child.value, str)
+    ]
+
+
+def topic_text(tree: ast.Module) -> List[str]:
+    """The learner-visible text of a topic module"""
+    texts = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        if name == "markdown_block" and node.args and isinstance(node.args[0], ast.Constant):
+            try:
+                texts.append(store.block(node.args[0].value).text)
+            except KeyError:
+                logger.warning("Unknown content block %r", node.args[0].value)
+        elif name == "lazy_tabs" and node.args and isinstance(node.args[0], ast.Dict):
+            for key in node.args[0].keys:
+                texts.extend(_strings(key))
+        elif name in TEXT_CALLS and node.args:
+            texts.extend(_strings(node.args[0]))
+    return texts
+
+
+def source_signature(topics_dir: Path = discovery.TOPICS_DIR,
+                     blocks_dir: Path = store.BLOCKS_DIR) -> str:
+    """Fingerprint of everything the index is built from"""
+    digest = hashlib.sha1(discovery.source_signature(topics_dir).encode())
+    for topic_id in store.topic_ids(blocks_dir):
+        digest.update(store.source_signature(topic_id, blocks_dir).encode())
+    return digest.hexdigest()
+
+
+def build_bytes(topics_dir: Path = discovery.TOPICS_DIR) -> bytes:
+    """Scan the topics and serialise the index"""
+    manifest = discovery.scan(topics_dir)
+    package_root = topics_dir.parent.parent
+    docs = []
+    postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+
+    for category in manifest["categories"]:
+        for topic in category["topics"]:
+            doc = len(docs)
+            docs.append([topic["id"], topic["title"]])
+            path = package_root / (topic["module"].replace(".", "/") + ".py")
+            counts = Counter()
+            for text in topic_text(discovery._parse(path)):
+                counts.update(tokenize(text))
+            for term in tokenize(topic["title"]):
+                counts[term] += TITLE_WEIGHT
+            for term, count in counts.items():
+                postings[term][doc] = min(count, 0xFFFF)
+
+    terms = sorted(postings, key=lambda term: term.encode("utf-8"))
+    term_table, text, posting_data = bytearray(), bytearray(), bytearray()
+    for term in terms:
+        encoded = term.encode("utf-8")
+        docs_for_term = postings[term]
+        term_table += TERM.pack(
+            len(text), len(encoded), len(posting_data) // POSTING.size,
+            len(docs_for_term), sum(docs_for_term.values())
+        )
+        text += encoded
+        for doc, count in sorted(docs_for_term.items()):
+            posting_data += POSTING.pack(doc, count)
+
+    doc_data = json.dumps(docs, ensure_ascii=False).encode("utf-8")
+    header = HEADER.pack(
+        INDEX_MAGIC, INDEX_VERSION, source_signature(topics_dir).encode("ascii"),
+        len(doc_data), len(terms), len(text)
+    )
+    return header + doc_data + term_table + text + posting_data
+
+
+def build_index(path: Path = INDEX_PATH) -> int:
+    """Write the index file; returns its size in bytes"""
+    data = build_bytes()
+    path.write_bytes(data)
+    return len(data)
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    topic_id: str
+    title: str
+    score: int
+
+
+class SearchIndex:
+    """Read-only view of a serialised index (a mmap or bytes)"""
+
+    def __init__(self, data):
+        magic, version, signature, doc_size, term_count, text_size = HEADER.unpack_from(data, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError("Not a search index of this version")
+        self.signature = signature.decode("ascii")
+        self._data = data
+        self.docs: List[Tuple[str, str]] = [
+            tuple(doc) for doc in json.loads(bytes(data[HEADER.size:HEADER.size + doc_size]))
+        ]
+        self._term_count = term_count
+        self._terms_at = HEADER.size + doc_size
+        self._text_at = self._terms_at + term_count * TERM.size
+        self._postings_at = self._text_at + text_size
+
+    def _term(self, i: int) -> Tuple[bytes, int, int, int]:
+        text_offset, length, postings, count, frequency = TERM.unpack_from(
+            self._data, self._terms_at + i * TERM.size
+        )
+        start = self._text_at + text_offset
+        return self._data[start:start + length], postings, count, frequency
+
+    def _lower_bound(self, key: bytes) -> int:
+        low, high = 0, self._term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._term(middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _prefix_range(self, prefix: str) -> range:
+        key = prefix.encode("utf-8")
+        # 0xFF never occurs in UTF-8, so it sorts after every continuation
+        return range(self._lower_bound(key), self._lower_bound(key + b"\xff"))
+
+    def _postings(self, i: int) -> Dict[int, int]:
+        _, postings, count, _ = self._term(i)
+        start = self._postings_at + postings * POSTING.size
+        return {
+            doc: frequency
+            for doc, frequency in POSTING.iter_unpack(self._data[start:start + count * POSTING.size])
+        }
+
+    def complete(self, prefix: str, limit: int = 5) -> List[str]:
+        """Indexed terms starting with `prefix`, most frequent first"""
+        prefix = prefix.lower()
+        if not prefix:
+            return []
+        matches = [self._term(i) for i in self._prefix_range(prefix)]
+        matches.sort(key=lambda term: term[3], reverse=True)
+        return [term[0].decode("utf-8") for term in matches[:limit]]
+
+    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+        """Topics containing every query word; the last word may be a prefix"""
+        words = tokenize(query)
+        if not words:
+            return []
+
+        scores: Optional[Dict[int, int]] = None
+        for n, word in enumerate(words):
+            if n == len(words) - 1:
+                candidates = self._prefix_range(word)
+            else:
+                i = self._lower_bound(word.encode("utf-8"))
+                exact = i < self._term_count and self._term(i)[0] == word.encode("utf-8")
+                candidates = range(i, i + 1) if exact else range(0)
+
+            matched: Dict[int, int] = {}
+            for i in candidates:
+                for doc, frequency in self._postings(i).items():
+                    matched[doc] = matched.get(doc, 0) + frequency
+            if scores is None:
+                scores = matched
+            else:
+                scores = {doc: score + matched[doc] for doc, score in scores.items() if doc in matched}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [SearchResult(*self.docs[doc], score) for doc, score in ranked]
+
+
+_lock = threading.Lock()
+_index: Optional[SearchIndex] = None
+
+
+def get_index(path: Path = INDEX_PATH) -> SearchIndex:
+    """The process-wide index, mapped from disk on first use"""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = _open(path)
+    return _index
+
+
+def _open(path: Path) -> SearchIndex:
+    try:
+        with open(path, "rb") as f:
+            index = SearchIndex(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    except (OSError, ValueError, struct.error):
+        logger.info("No search index at %s, building it in memory", path)
+        return SearchIndex(build_bytes())
+
+    if index.signature != source_signature():
+        logger.warning("Search index %s is stale, building it in memory", path)
+        return SearchIndex(build_bytes())
+    return index
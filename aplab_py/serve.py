@@ -0,0 +1,260 @@
+# aplab_py/serve.py
+
+"""Pre-forked serving mode: `python -m aplab_py.serve --workers 4`.
+
+One Streamlit process per container serialises every session's figure
+building on a single GIL. This launcher instead
+
+1. imports Streamlit, the heavy libraries and every topic module once,
+2. freezes the GC heap so those objects are never touched again by the
+   collector (which would dirty their pages and break copy-on-write),
+3. forks N Streamlit workers on 127.0.0.1, one port each,
+4. forks a front that listens on the public port and pipes each
+   connection to a worker picked from the browser's CLIENT_COOKIE, so a
+   browser's HTTP requests and its websocket land on the same worker and
+   its session state,
+5. waits on its children and starts any that exits again.
+
+The front reads the head of the first request on a connection for the
+cookie; a browser without one is given a new id in the response, so
+browsers behind one NAT or proxy still spread over the workers. After
+the heads it is a plain TCP pipe, so websockets need no special
+handling. If a worker is down, the connection goes to the next one in
+the ring until the parent has restarted it.
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import re
+import signal
+import sys
+import time
+import uuid
+import zlib
+from typing import Dict, List, Optional
+
+from aplab_py import lazy
+from aplab_py.config.setting import (
+    SERVE_PORT,
+    SERVE_RESTART_SECONDS,
+    SERVE_WORKER_BASE_PORT,
+    SERVE_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+CHUNK_SIZE = 64 * 1024
+
+# Pins a browser to a worker; only ever read by the front
+CLIENT_COOKIE = "aplab_client"
+CLIENT_ID = re.compile(r"[0-9a-f]{32}")
+CLIENT_COOKIE_MAX_AGE = 365 * 24 * 3600
+HEAD_END = b"\r\n\r\n"
+
+
+def preload():
+    """Import everything the workers would otherwise import on their own"""
+    import streamlit.web.cli  # noqa: F401  (server, tornado, protobufs)
+
+    from aplab_py.components import theme
+    from aplab_py.content import store
+    from aplab_py.i18n import catalogs
+    from aplab_py.registry import TopicRegistry
+    from aplab_py.search import index as search_index
+    from aplab_py.topics import discovery
+
+    registry = TopicRegistry(discovery.as_topics(discovery.manifest()))
+    for module_path in registry.module_paths:
+        registry.load(module_path)
+    lazy.preload()
+    theme.register()
+    catalogs.catalog(catalogs.DEFAULT_LOCALE)
+    for topic_id in store.topic_ids():
+        store.topic_blocks(topic_id)
+    search_index.get_index()
+
+    gc.collect()
+    gc.freeze()
+    logger.info("preloaded %d topics, %d objects frozen",
+                len(registry.module_paths), gc.get_freeze_count())
+
+
+def run_worker(port: int):
+    """Child process: run the app as `streamlit run` would, never returns"""
+    from streamlit.web import cli
+
+    sys.argv = [
+        "streamlit", "run", APP_PATH,
+        "--server.port", str(port),
+        "--server.address", "127.0.0.1",
+        "--server.headless", "true",
+        "--server.fileWatcherType", "none",
+        "--browser.gatherUsageStats", "false",
+    ]
+    try:
+        cli.main()
+    finally:
+        os._exit(0)
+
+
+def _in_child():
+    """Drop the parent's signal handlers, which stop every child"""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+
+def fork_worker(port: int) -> int:
+    pid = os.fork()
+    if pid == 0:
+        _in_child()
+        run_worker(port)
+    logger.info("worker %d on port %d", pid, port)
+    return pid
+
+
+def run_front(ports: List[int], address: str, port: int):
+    """Child process: run the front, never returns"""
+    try:
+        asyncio.run(StickyFront(ports).serve(address, port))
+    finally:
+        os._exit(0)
+
+
+def fork_front(ports: List[int], address: str, port: int) -> int:
+    pid = os.fork()
+    if pid == 0:
+        _in_child()
+        run_front(ports, address, port)
+    return pid
+
+
+async def pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        while data := await reader.read(CHUNK_SIZE):
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def client_id(head: bytes) -> Optional[str]:
+    """The CLIENT_COOKIE of an HTTP request head, if it has a valid one"""
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() != "cookie":
+            continue
+        for cookie in value.split(";"):
+            cookie_name, _, cookie_value = cookie.strip().partition("=")
+            if cookie_name == CLIENT_COOKIE and CLIENT_ID.fullmatch(cookie_value):
+                return cookie_value
+    return None
+
+
+def set_cookie(head: bytes, client: str) -> bytes:
+    """An HTTP response head with the CLIENT_COOKIE added"""
+    cookie = (f"Set-Cookie: {CLIENT_COOKIE}={client}; Path=/; Max-Age={CLIENT_COOKIE_MAX_AGE}; "
+              f"HttpOnly; SameSite=Lax\r\n")
+    return head[:-len(HEAD_END) + 2] + cookie.encode("latin-1") + b"\r\n"
+
+
+class StickyFront:
+    """Routes each browser to the same worker port by its CLIENT_COOKIE"""
+
+    def __init__(self, ports: List[int]):
+        self.ports = ports
+
+    def candidates(self, client: str) -> List[int]:
+        start = zlib.crc32(client.encode()) % len(self.ports)
+        return self.ports[start:] + self.ports[:start]
+
+    async def handle(self, client_reader: asyncio.StreamReader,
+                     client_writer: asyncio.StreamWriter):
+        try:
+            head = await client_reader.readuntil(HEAD_END)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            client_writer.close()
+            return
+        client = client_id(head)
+        new_client = client is None
+        if new_client:
+            client = uuid.uuid4().hex
+        for port in self.candidates(client):
+            try:
+                worker_reader, worker_writer = await asyncio.open_connection("127.0.0.1", port)
+                break
+            except OSError:
+                logger.warning("worker on port %d is not accepting connections", port)
+        else:
+            client_writer.close()
+            return
+        worker_writer.write(head)
+        if new_client:
+            try:
+                response = await worker_reader.readuntil(HEAD_END)
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                worker_writer.close()
+                client_writer.close()
+                return
+            client_writer.write(set_cookie(response, client))
+        await asyncio.gather(
+            pipe(client_reader, worker_writer),
+            pipe(worker_reader, client_writer),
+        )
+
+    async def serve(self, address: str, port: int):
+        server = await asyncio.start_server(self.handle, address, port)
+        logger.info("listening on http://%s:%d", address, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m aplab_py.serve", description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=SERVE_WORKERS or os.cpu_count() or 1)
+    parser.add_argument("--address", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=SERVE_PORT)
+    parser.add_argument("--worker-base-port", type=int, default=SERVE_WORKER_BASE_PORT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+
+    preload()
+    ports = [args.worker_base_port + i for i in range(args.workers)]
+    # This process only forks and waits, so no thread or event loop is
+    # running when a worker is forked again
+    workers: Dict[int, int] = {fork_worker(port): port for port in ports}
+    front = fork_front(ports, args.address, args.port)
+
+    def stop(signum, frame):
+        for pid in [front, *workers]:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while True:
+        pid, status = os.wait()
+        if pid == front:
+            logger.warning("front exited with status %d, restarting", status)
+            time.sleep(SERVE_RESTART_SECONDS)
+            front = fork_front(ports, args.address, args.port)
+        elif pid in workers:
+            port = workers.pop(pid)
+            logger.warning("worker %d on port %d exited with status %d, restarting",
+                           pid, port, status)
+            time.sleep(SERVE_RESTART_SECONDS)
+            workers[fork_worker(port)] = port
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+# aplab_py/state/accounting.py
+
+"""Approximate memory held in `st.session_state`, per session and topic.
+
+Topic modules set their own keys (`cart`, `catalog`, histories...) and
+nothing ever removed them, so a worker's memory only grew. `accounts`
+keeps a record for each session of the server process:
+
+- keys added while a topic's `show()` or one of its sections runs belong
+  to that topic's namespace, every other key to APP_NAMESPACE;
+- every SESSION_ACCOUNTING_SECONDS a daemon thread measures all sessions
+  and, while they add up to more than SESSION_MEMORY_BUDGET_BYTES, spills
+  the topic keys of the sessions idle longest to a pickle file;
+- the next run of a spilled session loads its keys back before the page
+  renders, so the learner finds the page as they left it;
+- with a learner id, a topic's keys are also kept in the persistence
+  backend (aplab_py.state.persistence) and read back the first time the
+  session shows the topic.
+
+Values that cannot be pickled (a running race) and widget values (which
+Streamlit keeps in step with the browser) stay in memory. Sizes follow the
+references of each value (`deep_sizeof`), so they are estimates: an
+object shared by two keys is counted under the first one only.
+
+The records hold Streamlit's SessionState behind `st.session_state`, a
+private class. If a Streamlit upgrade changes what they use of it
+(`_state_internals`), accounting, spilling and persistence turn off
+with a warning and the app runs on without them.
+"""
+
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from aplab_py.config.setting import (
+    SESSION_ACCOUNTING_SECONDS,
+    SESSION_IDLE_SECONDS,
+    SESSION_MEMORY_BUDGET_BYTES,
+    SESSION_SPILL_DIR,
+    SESSION_SPILL_MIN_BYTES,
+)
+from aplab_py.state import persistence
+
+logger = logging.getLogger(__name__)
+
+APP_NAMESPACE = "app"
+
+# Shared by every session of the process, never counted
+_SHARED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+_SEQUENCES = (list, tuple, set, frozenset, deque)
+
+
+def _slot_values(item) -> List:
+    values = []
+    for cls in type(item).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(item, name):
+                values.append(getattr(item, name))
+    return values
+
+
+def deep_sizeof(obj, seen: Optional[Set[int]] = None) -> int:
+    """Bytes of `obj` and of everything it references, each object once.
+
+    Objects with a `__sizeof__` of their own (typed arrays, NumPy arrays,
+    DataFrames) include their buffers in it and are not looked into.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _SHARED):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, _SEQUENCES):
+            stack.extend(item)
+        elif type(item).__sizeof__ is object.__sizeof__:
+            if hasattr(item, "__dict__"):
+                stack.append(item.__dict__)
+            stack.extend(_slot_values(item))
+    return total
+
+
+# What the records use of Streamlit's private SessionState
+_STATE_ATTRIBUTES = ("filtered_state", "_key_id_mapper", "__contains__", "__getitem__",
+                     "__setitem__", "__delitem__")
+_state_internals = True
+
+
+def _session_state(ctx) -> Optional[object]:
+    """The SessionState behind `st.session_state` in `ctx`.
+
+    None once Streamlit turns out not to have the internals the records
+    use; like the plotly fast path in components/charts.py, the records
+    are then skipped for the rest of the process.
+    """
+    global _state_internals
+    if not _state_internals:
+        return None
+    state = getattr(ctx.session_state, "_state", None)
+    missing = [name for name in _STATE_ATTRIBUTES if not hasattr(state, name)]
+    if not missing:
+        return state
+    logger.warning("Streamlit %s has no SessionState %s; session memory accounting, "
+                   "spilling and persistence are off", st.__version__, ", ".join(missing))
+    _state_internals = False
+    return None
+
+
+def _is_widget(state, key: str) -> bool:
+    """Whether `key` is a widget's, which Streamlit keeps in step with the browser"""
+    return key in state._key_id_mapper
+
+
+def _closed(session_id: str) -> bool:
+    """Whether the server has closed the session (never, without a server)"""
+    if not runtime.exists():
+        return False
+    # AppTest's stand-in runtime has no session manager
+    sessions = getattr(runtime.get_instance(), "_session_mgr", None)
+    return sessions is not None and sessions.get_session_info(session_id) is None
+
+
+@dataclass
+class SessionRecord:
+    session_id: str
+    state: object  # the session's SessionState
+    last_seen: float
+    topic: str = APP_NAMESPACE  # namespace of the topic shown last
+    owners: Dict[str, str] = field(default_factory=dict)  # key -> namespace
+    spill_path: Optional[str] = None
+    spilled: Set[str] = field(default_factory=set)
+    learner: Optional[str] = None
+    loaded: Set[str] = field(default_factory=set)  # namespaces read from the backend
+    saved: Dict[str, Tuple[str, int]] = field(default_factory=dict)  # key -> (namespace, hash)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass(frozen=True)
+class SessionUsage:
+    """One session's state when it was measured"""
+    session_id: str
+    idle_seconds: float
+    keys: Dict[str, Tuple[str, int]]  # key -> (namespace, bytes)
+    spilled_keys: int
+
+    @property
+    def total(self) -> int:
+        return sum(size for _, size in self.keys.values())
+
+    @property
+    def namespaces(self) -> Dict[str, int]:
+        sizes: Dict[str, int] = {}
+        for namespace, size in self.keys.values():
+            sizes[namespace] = sizes.get(namespace, 0) + size
+        return sizes
+
+
+class SessionAccounts:
+    """Memory records of the sessions of this process, and their spilling"""
+
+    def __init__(self, budget: Optional[int] = SESSION_MEMORY_BUDGET_BYTES,
+                 idle_seconds: float = SESSION_IDLE_SECONDS,
+                 interval: float = SESSION_ACCOUNTING_SECONDS,
+                 spill_dir: Optional[str] = SESSION_SPILL_DIR):
+        self.budget = budget
+        self.idle_seconds = idle_seconds
+        self.interval = interval
+        self.spill_dir = spill_dir
+        self.spilled_bytes = 0
+        self.unpicklable_keys = 0
+        self._records: Dict[str, SessionRecord] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _current(self) -> Optional[SessionRecord]:
+        ctx = get_script_run_ctx(suppress_warning=True)
+        if ctx is None:
+            return None
+        # ctx.session_state is a wrapper made for each script runner, and
+        # holds on to it; the SessionState inside lives as long as the session
+        state = _session_state(ctx)
+        if state is None:
+            return None
+        with self._lock:
+            record = self._records.get(ctx.session_id)
+            if record is None:
+                record = SessionRecord(ctx.session_id, state, time.monotonic())
+                self._records[ctx.session_id] = record
+            if self._thread is None and self.budget is not None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="aplab-session-accounting",
+                    daemon=True
+                )
+                self._thread.start()
+        return record
+
+    def touch(self, learner: Optional[str] = None):
+        """Mark the running session active and load back its spilled keys.
+
+        `learner` ties the session to the learner's persisted state.
+        """
+        record = self._current()
+        if record is None:
+            return
+        with record.lock:
+            if learner is not None:
+                record.learner = learner
+            record.last_seen = time.monotonic()
+            if record.spill_path is not None:
+                self._restore(record)
+
+    @contextmanager
+    def namespace(self, name: Optional[str] = None):
+        """Count the keys added inside the block as topic `name`'s.
+
+        Without a name, the topic the running session showed last.
+        """
+        record = self._current()
+        if record is None:
+            yield
+            return
+        state = record.state
+        if name is not None:
+            record.topic = name
+        name = record.topic
+        backend = persistence.backend() if record.learner is not None else None
+        if backend is not None and name != APP_NAMESPACE and name not in record.loaded:
+            self._load(record, backend, name)
+        before = set(state.filtered_state)
+        try:
+            yield
+        finally:
+            added = set(state.filtered_state) - before
+            with record.lock:
+                for key in added:
+                    record.owners[key] = name
+            if backend is not None and name != APP_NAMESPACE:
+                self._save(record, backend, name)
+
+    def release(self, keys: Iterable[str]):
+        """Note that the running session dropped `keys` to save memory.
+
+        Their stored copies stay in the backend, and their namespaces are
+        read from it again the next time they are shown.
+        """
+        record = self._current()
+        if record is None:
+            return
+        with record.lock:
+            for key in keys:
+                namespace = record.owners.pop(key, None)
+                record.saved.pop(key, None)
+                record.loaded.discard(namespace)
+
+    def _load(self, record: SessionRecord, backend: persistence.SessionBackend, name: str):
+        record.loaded.add(name)
+        try:
+            blobs = backend.load(record.learner, name)
+        except Exception as e:
+            logger.warning("Could not load %s state of learner %s: %s", name, record.learner, e)
+            return
+        state = record.state
+        for key, blob in blobs.items():
+            record.saved[key] = (name, hash(blob))
+            if key in state:
+                continue
+            try:
+                state[key] = persistence.decode(blob)
+            except Exception as e:
+                logger.info("Ignoring stored session key %r: %s", key, e)
+                continue
+            record.owners[key] = name
+
+    def _save(self, record: SessionRecord, backend: persistence.SessionBackend, name: str):
+        """Queue the keys of namespace `name` that changed since last saved"""
+        state = record.state
+        with record.lock:
+            for key, owner in list(record.owners.items()):
+                if owner != name or key not in state or _is_widget(state, key):
+                    continue
+                try:
+                    blob = persistence.encode(state[key])
+                except Exception:  # e.g. a running race
+                    continue
+                digest = hash(blob)
+                if record.saved.get(key) != (name, digest):
+                    record.saved[key] = (name, digest)
+                    backend.save(record.learner, name, key, blob)
+            for key, (owner, _) in list(record.saved.items()):
+                if owner == name and key not in state and key not in record.spilled:
+                    del record.saved[key]
+                    backend.save(record.learner, name, key, None)
+
+    def measure(self) -> List[SessionUsage]:
+        """Sizes of every live session's state; closed sessions are forgotten"""
+        with self._lock:
+            records = list(self._records.values())
+        usages = []
+        now = time.monotonic()
+        for record in records:
+            if _closed(record.session_id):
+                with self._lock:
+                    self._records.pop(record.session_id, None)
+                self._forget(record)
+                continue
+            usage = self._measure(record, record.state, now)
+            if usage is not None:
+                usages.append(usage)
+        return usages
+
+    def _measure(self, record: SessionRecord, state, now: float) -> Optional[SessionUsage]:
+        try:
+            values = state.filtered_state
+        except RuntimeError:  # its script run is changing it; next time
+            return None
+        seen: Set[int] = set()
+        keys = {}
+        for key, value in values.items():
+            try:
+                size = deep_sizeof(value, seen)
+            except RuntimeError:  # changed by its session while measured
+                size = sys.getsizeof(value)
+            keys[key] = (record.owners.get(key, APP_NAMESPACE), size)
+        with record.lock:
+            for key in list(record.owners):
+                if key not in values and key not in record.spilled:
+                    del record.owners[key]
+            spilled = len(record.spilled)
+        return SessionUsage(record.session_id, now - record.last_seen, keys, spilled)
+
+    def enforce(self) -> int:
+        """Spill idle sessions, longest idle first, until under budget.
+
+        Returns the bytes taken out of memory.
+        """
+        usages = self.measure()
+        if self.budget is None:
+            return 0
+        excess = sum(usage.total for usage in usages) - self.budget
+        freed = 0
+        for usage in sorted(usages, key=lambda usage: -usage.idle_seconds):
+            if freed >= excess or usage.idle_seconds < self.idle_seconds:
+                break
+            with self._lock:
+                record = self._records.get(usage.session_id)
+            if record is None:
+                continue
+            freed += self._spill(record, {
+                key: size for key, (namespace, size) in usage.keys.items()
+                if namespace != APP_NAMESPACE and size >= SESSION_SPILL_MIN_BYTES
+            })
+        if freed:
+            logger.info("Spilled %d bytes of idle session state (over budget by %d)",
+                        freed, excess)
+        return freed
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.enforce()
+            except Exception:
+                logger.exception("Session accounting failed")
+
+    def _spill(self, record: SessionRecord, sizes: Dict[str, int]) -> int:
+        with record.lock:
+            state = record.state
+            if (not sizes
+                    or time.monotonic() - record.last_seen < self.idle_seconds):
+                return 0
+            blobs = self._read(record)
+            freed = 0
+            for key, size in sizes.items():
+                if _is_widget(state, key):
+                    continue
+                try:
+                    value = state[key]
+                except KeyError:
+                    continue
+                try:
+                    blobs[key] = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+                except Exception as e:
+                    logger.info("Keeping session key %r in memory: %s", key, e)
+                    self.unpicklable_keys += 1
+                    continue
+                record.spilled.add(key)
+                try:
+                    del state[key]
+                except KeyError:
+                    pass
+                freed += size
+            if blobs:
+                if self.spill_dir is None:
+                    self.spill_dir = tempfile.mkdtemp(prefix="aplab-sessions-")
+                record.spill_path = os.path.join(self.spill_dir, f"{record.session_id}.pickle")
+                with open(record.spill_path, "wb") as f:
+                    pickle.dump(blobs, f, pickle.HIGHEST_PROTOCOL)
+            self.spilled_bytes += freed
+            return freed
+
+    def _read(self, record: SessionRecord) -> Dict[str, bytes]:
+        if record.spill_path is None:
+            return {}
+        try:
+            with open(record.spill_path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning("Could not read spilled session state %s: %s", record.spill_path, e)
+            return {}
+
+    def _restore(self, record: SessionRecord):
+        state = record.state
+        for key, blob in self._read(record).items():
+            if key in state:
+                continue
+            try:
+                state[key] = pickle.loads(blob)
+            except Exception as e:
+                logger.warning("Could not restore session key %r: %s", key, e)
+        self._remove_spill(record)
+
+    def _remove_spill(self, record: SessionRecord):
+        if record.spill_path is not None:
+            try:
+                os.remove(record.spill_path)
+            except OSError:
+                pass
+        record.spill_path = None
+        record.spilled.clear()
+
+    def _forget(self, record: SessionRecord):
+        with record.lock:
+            self._remove_spill(record)
+
+
+accounts = SessionAccounts()
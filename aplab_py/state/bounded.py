@@ -0,0 +1,257 @@
+# aplab_py/state/bounded.py
+
+"""Session containers that stay the same size however long a learner clicks.
+
+Histories, lists and dicts kept in `st.session_state` used to grow with
+every click, and were shown in full (`my_list = {...}` in an st.code)
+on every rerun. These keep at most `capacity` items, dropping the oldest
+the way `collections.deque(maxlen=...)` does, and their reprs show the
+first and last few items only:
+
+    state = TopicState(__name__, score_history=lambda: RingBuffer(HISTORY_CAPACITY, [0]))
+    state.edit("score_history").append(score)
+    state.score_history.stats.mean   # over every value, O(1)
+"""
+
+import math
+from array import array
+from itertools import islice
+from typing import Callable, Collection, Iterable, Iterator, Optional
+
+from aplab_py.config.setting import COLLECTION_CAPACITY, HISTORY_CAPACITY
+
+# Items shown at each end of a truncated repr
+REPR_EDGE_ITEMS = 5
+
+
+def short_repr(items: Collection, opening: str = "[", closing: str = "]",
+               item_repr: Callable[..., str] = repr) -> str:
+    """repr of a collection, with the middle elided past 2 * REPR_EDGE_ITEMS"""
+    length = len(items)
+    if length <= 2 * REPR_EDGE_ITEMS:
+        shown = [item_repr(item) for item in items]
+    else:
+        head = [item_repr(item) for item in islice(items, REPR_EDGE_ITEMS)]
+        tail = [item_repr(item) for item in islice(items, length - REPR_EDGE_ITEMS, None)]
+        shown = head + [f"... {length - 2 * REPR_EDGE_ITEMS} more ..."] + tail
+    return opening + ", ".join(shown) + closing
+
+
+def _item_repr(item) -> str:
+    key, value = item
+    return f"{key!r}: {value!r}"
+
+
+class RunningStats:
+    """Count, total, min, max and mean of a stream, updated in O(1)"""
+
+    __slots__ = ("count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    def copy(self) -> "RunningStats":
+        copy = RunningStats()
+        copy.count, copy.total = self.count, self.total
+        copy.minimum, copy.maximum = self.minimum, self.maximum
+        return copy
+
+
+class RingBuffer:
+    """The last `capacity` numbers of a series, in a fixed typed array.
+
+    Floats by default; typecode "q" keeps ints as ints. `stats` covers
+    every value ever appended, not only the ones kept; `start` is the
+    position in the series of the oldest value kept.
+    """
+
+    __slots__ = ("capacity", "values", "head", "size", "stats")
+
+    def __init__(self, capacity: int = HISTORY_CAPACITY, initial: Iterable[float] = (),
+                 typecode: str = "d"):
+        self.capacity = capacity
+        self.values = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self.head = 0   # where the next value goes
+        self.size = 0
+        self.stats = RunningStats()
+        for value in initial:
+            self.append(value)
+
+    def stored(self, value: float) -> float:
+        """`value` as `append` would keep it"""
+        if self.values.typecode in "fd":
+            try:
+                return float(value)
+            except OverflowError:   # e.g. the int from a big **=
+                return math.inf if value > 0 else -math.inf
+        return value
+
+    def append(self, value: float):
+        value = self.stored(value)
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.stats.add(value)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[float]:
+        start = (self.head - self.size) % self.capacity
+        for k in range(self.size):
+            yield self.values[(start + k) % self.capacity]
+
+    def __getitem__(self, index: int) -> float:
+        if not -self.size <= index < self.size:
+            raise IndexError("ring buffer index out of range")
+        return self.values[(self.head - self.size + index % self.size) % self.capacity]
+
+    @property
+    def start(self) -> int:
+        return self.stats.count - self.size
+
+    @property
+    def last(self) -> Optional[float]:
+        return self[-1] if self.size else None
+
+    def tolist(self):
+        return list(self)
+
+    def copy(self) -> "RingBuffer":
+        copy = RingBuffer.__new__(RingBuffer)
+        copy.capacity = self.capacity
+        copy.values = array(self.values.typecode, self.values)
+        copy.head = self.head
+        copy.size = self.size
+        copy.stats = self.stats.copy()
+        return copy
+
+    def __reduce__(self):
+        # Always a RingBuffer, as for CappedList
+        return object.__new__, (RingBuffer,), (
+            None, {name: getattr(self, name) for name in RingBuffer.__slots__}
+        )
+
+    def __repr__(self):
+        return short_repr(self)
+
+
+class CappedList(list):
+    """A list of at most `capacity` items; adding past it drops the oldest.
+
+    Callers that would rather refuse new items check `full` first.
+    """
+
+    __slots__ = ("capacity",)
+
+    def __init__(self, items: Iterable = (), capacity: int = COLLECTION_CAPACITY):
+        self.capacity = capacity
+        super().__init__(items)
+        self._trim()
+
+    def _trim(self):
+        if len(self) > self.capacity:
+            del self[:len(self) - self.capacity]
+
+    @property
+    def full(self) -> bool:
+        return len(self) >= self.capacity
+
+    def append(self, item):
+        super().append(item)
+        self._trim()
+
+    def extend(self, items: Iterable):
+        super().extend(items)
+        self._trim()
+
+    def insert(self, index: int, item):
+        super().insert(index, item)
+        self._trim()
+
+    def __iadd__(self, items: Iterable):
+        self.extend(items)
+        return self
+
+    def __imul__(self, times: int):
+        super().__imul__(times)
+        self._trim()
+        return self
+
+    def __setitem__(self, index, value):
+        # A slice can be given more items than it replaces
+        super().__setitem__(index, value)
+        if isinstance(index, slice):
+            self._trim()
+
+    def copy(self) -> "CappedList":
+        return CappedList(self, self.capacity)
+
+    def __reduce__(self):
+        # list's own reduce appends the items before restoring capacity.
+        # Always a CappedList: a frozen one (see defaults.py) is only shared
+        # in memory, and its mutators would refuse the items
+        return CappedList, (list(self), self.capacity)
+
+    def __repr__(self):
+        return short_repr(self)
+
+
+class CappedDict(dict):
+    """A dict of at most `capacity` keys; a new key past it drops the oldest.
+
+    Changing the value of a key already there never drops anything.
+    """
+
+    __slots__ = ("capacity",)
+
+    def __init__(self, items=(), capacity: int = COLLECTION_CAPACITY):
+        self.capacity = capacity
+        super().__init__()
+        self.update(items)
+
+    @property
+    def full(self) -> bool:
+        return len(self) >= self.capacity
+
+    def __setitem__(self, key, value):
+        if key not in self and len(self) >= self.capacity:
+            del self[next(iter(self))]
+        super().__setitem__(key, value)
+
+    def update(self, items=(), **more):
+        pairs = items.items() if hasattr(items, "items") else items
+        for key, value in pairs:
+            self[key] = value
+        for key, value in more.items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def copy(self) -> "CappedDict":
+        return CappedDict(self, self.capacity)
+
+    def __reduce__(self):
+        # Always a CappedDict, as for CappedList
+        return CappedDict, (dict(self), self.capacity)
+
+    def __repr__(self):
+        return short_repr(self.items(), "{", "}", _item_repr)
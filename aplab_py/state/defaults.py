@@ -0,0 +1,87 @@
+# aplab_py/state/defaults.py
+
+"""Read-only values shared by every session of a process.
+
+Topic defaults used to be built again by every session that opened the
+topic: its own starter list, dict and history, identical to everybody
+else's. Now `TopicState` builds each default once, when the topic module
+is imported, and freezes it: a bounded container (see bounded.py) gets a
+read-only class whose changing methods raise TypeError, so no session
+can change what the others read. A session that changes a value first
+gets its own copy (`thaw`), so sessions that only look at a topic hold
+nothing of their own.
+
+Under `python -m aplab_py.serve` the topics are imported before the
+workers fork, so the workers start out reading the parent's copy.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Type
+
+from aplab_py.state.bounded import CappedDict, CappedList, RingBuffer
+
+# Shared as they are
+IMMUTABLE = (type(None), bool, int, float, complex, str, bytes, tuple, frozenset)
+
+_LIST_CHANGES = ("append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+                 "__setitem__", "__delitem__", "__iadd__", "__imul__")
+_DICT_CHANGES = ("__setitem__", "__delitem__", "pop", "popitem", "clear", "update",
+                 "setdefault", "__ior__")
+
+
+def _read_only(name: str) -> Callable:
+    def method(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is shared by every session and cannot be "
+                        f"changed; change the session's own copy from TopicState.edit()")
+    method.__name__ = name
+    return method
+
+
+def _forbid(cls: type, changes: Iterable[str]):
+    for name in changes:
+        setattr(cls, name, _read_only(name))
+
+
+# No slots of their own, so instances can switch to them in place. They
+# pickle as their mutable bases (see their __reduce__).
+
+class FrozenCappedList(CappedList):
+    __slots__ = ()
+
+
+class FrozenCappedDict(CappedDict):
+    __slots__ = ()
+
+
+class FrozenRingBuffer(RingBuffer):
+    __slots__ = ()
+
+
+_forbid(FrozenCappedList, _LIST_CHANGES)
+_forbid(FrozenCappedDict, _DICT_CHANGES)
+_forbid(FrozenRingBuffer, ("append",))
+
+_FROZEN: Dict[type, Type] = {
+    CappedList: FrozenCappedList,
+    CappedDict: FrozenCappedDict,
+    RingBuffer: FrozenRingBuffer,
+}
+_FROZEN_TYPES = tuple(_FROZEN.values())
+
+
+def freeze(value: Any) -> Any:
+    """Make `value` read-only in place and return it.
+
+    Raises TypeError for values that can be neither frozen nor shared as
+    they are.
+    """
+    frozen = _FROZEN.get(type(value))
+    if frozen is not None:
+        value.__class__ = frozen
+    elif not isinstance(value, IMMUTABLE + _FROZEN_TYPES):
+        raise TypeError(f"a {type(value).__name__} cannot be shared between sessions")
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """A copy of a frozen value for one session; immutable values as they are"""
+    return value.copy() if isinstance(value, _FROZEN_TYPES) else value
@@ -0,0 +1,229 @@
+# aplab_py/state/persistence.py
+
+"""Learner state that outlives the session, in a local SQLite file.
+
+A Streamlit session lives in one worker process, so a restart or a
+reconnect landing on another worker (`python -m aplab_py.serve`) used to
+start the learner over. With SESSION_STORE_PATH set, each browser gets a
+learner id in a cookie (LEARNER_COOKIE) and the topic state of its
+sessions (see aplab_py.state.accounting) is kept in `SESSION_STORE_PATH`,
+one row per (learner, topic namespace, key):
+
+- after a topic's page or section has run, its keys whose encoding
+  changed are queued; a background thread writes the queue every
+  SESSION_STORE_FLUSH_SECONDS in one transaction, and a key changed
+  again before that is written once, with its latest value;
+- the first time a session shows a topic, the topic's rows are read
+  back, so a learner who never opens a topic never loads its state.
+
+Every worker of a machine opens the same file (WAL mode, so readers do
+not wait for the writer). Values are pickles behind a two-byte header,
+format version and flags; rows of another version are ignored. Widget
+values are not kept: the browser sends those for the page on screen.
+The rows are only ever written by the server itself, and rows not
+written for SESSION_STORE_MAX_AGE_SECONDS are deleted on startup.
+"""
+
+import atexit
+import logging
+import pickle
+import re
+import sqlite3
+import struct
+import threading
+import time
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+from aplab_py.config.setting import (
+    SESSION_STORE_FLUSH_SECONDS,
+    SESSION_STORE_MAX_AGE_SECONDS,
+    SESSION_STORE_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+ENCODING_VERSION = 1
+HEADER = struct.Struct("<BB")   # version, flags
+COMPRESSED = 1
+# Pickles longer than this are zlib-compressed
+COMPRESS_MIN_BYTES = 256
+
+LEARNER_ID = re.compile(r"[0-9a-f]{32}")
+# Holds the learner id in the browser, out of the links learners share
+LEARNER_COOKIE = "aplab_learner"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_state (
+    learner TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (learner, namespace, key)
+) WITHOUT ROWID
+"""
+
+
+def encode(value: Any) -> bytes:
+    """Raises what pickle raises if `value` cannot be pickled"""
+    data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    flags = 0
+    if len(data) > COMPRESS_MIN_BYTES:
+        data = zlib.compress(data)
+        flags |= COMPRESSED
+    return HEADER.pack(ENCODING_VERSION, flags) + data
+
+
+def decode(blob: bytes) -> Any:
+    """Raises ValueError for a blob of another format version"""
+    version, flags = HEADER.unpack_from(blob)
+    if version != ENCODING_VERSION:
+        raise ValueError(f"session state encoding version {version}, expected {ENCODING_VERSION}")
+    data = blob[HEADER.size:]
+    if flags & COMPRESSED:
+        data = zlib.decompress(data)
+    return pickle.loads(data)
+
+
+def new_learner_id() -> str:
+    return uuid.uuid4().hex
+
+
+Key = Tuple[str, str, str]  # learner, namespace, key
+
+
+class SessionBackend(ABC):
+    """Where learner state goes between sessions.
+
+    `save` may return before the value is stored; `load` sees every
+    value saved before it, stored or not.
+    """
+
+    @abstractmethod
+    def load(self, learner: str, namespace: str) -> Dict[str, bytes]:
+        """Encoded values of one topic namespace, by key"""
+
+    @abstractmethod
+    def save(self, learner: str, namespace: str, key: str, blob: Optional[bytes]):
+        """Store an encoded value; None deletes the key"""
+
+    def flush(self):
+        """Store everything saved so far"""
+
+
+class SQLiteBackend(SessionBackend):
+    """Write-behind store: saves are queued, coalesced by key, written in batches"""
+
+    def __init__(self, path: str, flush_seconds: float = SESSION_STORE_FLUSH_SECONDS,
+                 max_age_seconds: float = SESSION_STORE_MAX_AGE_SECONDS):
+        self.path = path
+        self.flush_seconds = flush_seconds
+        self.max_age_seconds = max_age_seconds
+        self.written = 0
+        self.coalesced = 0
+        self._pending: Dict[Key, Optional[bytes]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._thread: Optional[threading.Thread] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection; sqlite3 connections stay in their thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=10)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def load(self, learner: str, namespace: str) -> Dict[str, bytes]:
+        rows = self._connection().execute(
+            "SELECT key, value FROM session_state WHERE learner = ? AND namespace = ?",
+            (learner, namespace)
+        )
+        blobs = dict(rows)
+        # Saves the writer has not got to yet are newer than the rows
+        with self._lock:
+            for (row_learner, row_namespace, key), blob in self._pending.items():
+                if row_learner == learner and row_namespace == namespace:
+                    if blob is None:
+                        blobs.pop(key, None)
+                    else:
+                        blobs[key] = blob
+        return blobs
+
+    def save(self, learner: str, namespace: str, key: str, blob: Optional[bytes]):
+        with self._lock:
+            if (learner, namespace, key) in self._pending:
+                self.coalesced += 1
+            self._pending[learner, namespace, key] = blob
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="aplab-session-store",
+                    daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        now = time.time()
+        try:
+            with self._connection() as connection:
+                connection.executemany(
+                    "INSERT INTO session_state (learner, namespace, key, value, updated) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT (learner, namespace, key) "
+                    "DO UPDATE SET value = excluded.value, updated = excluded.updated",
+                    [(*row, blob, now) for row, blob in batch.items() if blob is not None]
+                )
+                connection.executemany(
+                    "DELETE FROM session_state WHERE learner = ? AND namespace = ? AND key = ?",
+                    [row for row, blob in batch.items() if blob is None]
+                )
+        except sqlite3.Error as e:
+            logger.warning("Could not write %d session state rows, retrying: %s", len(batch), e)
+            with self._lock:
+                # Keep anything saved since, it is newer
+                self._pending = {**batch, **self._pending}
+            return
+        self.written += len(batch)
+
+    def _run(self):
+        with self._connection() as connection:
+            connection.execute(
+                "DELETE FROM session_state WHERE updated < ?",
+                (time.time() - self.max_age_seconds,)
+            )
+        while True:
+            time.sleep(self.flush_seconds)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Session state writer failed")
+
+
+_backend: Optional[SessionBackend] = None
+_backend_lock = threading.Lock()
+
+
+def backend() -> Optional[SessionBackend]:
+    """The process-wide backend, or None when SESSION_STORE_PATH is not set.
+
+    Opened on first use, so each worker forked by aplab_py.serve gets
+    its own connections and writer thread.
+    """
+    global _backend
+    if SESSION_STORE_PATH is None:
+        return None
+    with _backend_lock:
+        if _backend is None:
+            _backend = SQLiteBackend(SESSION_STORE_PATH)
+        return _backend
@@ -0,0 +1,159 @@
+# aplab_py/state/topic_state.py
+
+"""Session state of a topic, under keys of its own.
+
+Topic modules used to write flat keys (`counter`, `score`, `balance`...)
+straight into `st.session_state`: two topics could pick the same name,
+and every topic a learner had visited kept its state for good. A
+`TopicState` is declared once at module level with the defaults of its
+values, and keys them by the module path listed in TOPICS:
+
+    state = TopicState(__name__, counter=0, history=lambda: RingBuffer(HISTORY_CAPACITY))
+
+    state.counter += 1                  # st.session_state["<module>:counter"]
+    state.edit("history").append(...)   # changed in place: the session's copy
+
+A callable default is a factory, called once per process; defaults are
+shared read-only by every session (see defaults.py). Until a session
+sets or edits a value, reading it returns the shared default, and the
+session keeps nothing for it. app.py calls `visit()` with the topic on
+screen on every full run, and a section rerunning on its own as a
+fragment calls `touch()` with its module; a topic not shown for
+TOPIC_UNLOAD_SECONDS is unloaded by its policy:
+
+- KEEP leaves its values alone;
+- COMPACT drops the values still equal to their defaults, and the
+  `transient` ones;
+- RELEASE drops them all.
+
+Functions registered with `on_unload` run first. Dropped values read
+as their defaults again, or come back from the persistence backend when
+there is one (see aplab_py.state.accounting).
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import streamlit as st
+
+from aplab_py.config.setting import TOPIC_UNLOAD_SECONDS
+from aplab_py.state.defaults import freeze, thaw
+
+KEEP = "keep"
+COMPACT = "compact"
+RELEASE = "release"
+
+# When each topic was last shown in the session, by module path
+VISITS_KEY = "topic_visits"
+
+_topics: Dict[str, "TopicState"] = {}
+
+
+class TopicState:
+    """The declared values of one topic module, read and set as attributes"""
+
+    __slots__ = ("module", "policy", "transient", "_defaults", "_keys", "_hooks")
+
+    def __init__(self, module: str, policy: str = COMPACT, transient: Iterable[str] = (),
+                 **defaults):
+        if policy not in (KEEP, COMPACT, RELEASE):
+            raise ValueError(f"unknown unload policy {policy!r}")
+        object.__setattr__(self, "module", module)
+        object.__setattr__(self, "policy", policy)
+        object.__setattr__(self, "transient", frozenset(transient))
+        object.__setattr__(self, "_defaults", {
+            name: freeze(default() if callable(default) else default)
+            for name, default in defaults.items()
+        })
+        object.__setattr__(self, "_keys", {name: f"{module}:{name}" for name in defaults})
+        object.__setattr__(self, "_hooks", [])
+        _topics[module] = self
+
+    def key(self, name: str) -> str:
+        """The session state key of value `name`"""
+        try:
+            return self._keys[name]
+        except KeyError:
+            raise AttributeError(f"{self.module} declares no state {name!r}") from None
+
+    def default(self, name: str) -> Any:
+        """The shared, read-only default of value `name`"""
+        self.key(name)
+        return self._defaults[name]
+
+    def __getattr__(self, name: str) -> Any:
+        """The session's value, or else the shared default; not to be changed in place"""
+        key = self.key(name)
+        if key in st.session_state:
+            return st.session_state[key]
+        return self._defaults[name]
+
+    def edit(self, name: str) -> Any:
+        """The session's own value `name`, copied from the default if need be"""
+        key = self.key(name)
+        if key not in st.session_state:
+            st.session_state[key] = thaw(self._defaults[name])
+        return st.session_state[key]
+
+    def __setattr__(self, name: str, value: Any):
+        st.session_state[self.key(name)] = value
+
+    def __delattr__(self, name: str):
+        """Back to the shared default"""
+        key = self.key(name)
+        if key in st.session_state:
+            del st.session_state[key]
+
+    def __contains__(self, name: str) -> bool:
+        """Whether the session has a value `name` of its own"""
+        return self.key(name) in st.session_state
+
+    def on_unload(self, hook: Callable[["TopicState"], None]) -> Callable[["TopicState"], None]:
+        """Run `hook(state)` before the topic is unloaded; usable as a decorator"""
+        self._hooks.append(hook)
+        return hook
+
+    def _is_default(self, name: str) -> bool:
+        try:
+            return bool(st.session_state[self._keys[name]] == self._defaults[name])
+        except Exception:  # values without a plain ==
+            return False
+
+    def unload(self) -> List[str]:
+        """Apply the unload policy; returns the keys dropped"""
+        for hook in self._hooks:
+            hook(self)
+        if self.policy == KEEP:
+            return []
+        dropped = [
+            key for name, key in self._keys.items()
+            if key in st.session_state and (
+                self.policy == RELEASE or name in self.transient or self._is_default(name)
+            )
+        ]
+        for key in dropped:
+            del st.session_state[key]
+        return dropped
+
+
+def touch(module: str) -> float:
+    """Note `module` as on screen; returns the time noted"""
+    now = time.time()
+    st.session_state.setdefault(VISITS_KEY, {})[module] = now
+    return now
+
+
+def visit(module: str) -> List[Tuple[str, List[str]]]:
+    """Note `module` as on screen and unload the topics left long ago.
+
+    Returns (module, keys dropped) for each topic unloaded.
+    """
+    now = touch(module)
+    visits = st.session_state[VISITS_KEY]
+    unloaded = []
+    for other, seen in list(visits.items()):
+        if other != module and now - seen >= TOPIC_UNLOAD_SECONDS:
+            del visits[other]
+            if other in _topics:
+                unloaded.append((other, _topics[other].unload()))
+    return unloaded
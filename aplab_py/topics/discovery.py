@@ -0,0 +1,176 @@
+# aplab_py/topics/discovery.py
+
+"""Topic discovery without importing topic modules.
+
+Category packages under `aplab_py/topics` declare `CATEGORY` (and
+optionally `ORDER`) in their `__init__.py`; topic modules declare
+`TITLE`, `ORDER` and `LANGUAGES` as plain literals at module level.
+`scan()` reads those with `ast` and also records each topic's imports
+as its dependencies. `build_manifest()` writes the result to
+`manifest.json`, which the app reads once per process (`manifest()`).
+"""
+
+import ast
+import functools
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TOPICS_DIR = Path(__file__).resolve().parent
+MANIFEST_PATH = TOPICS_DIR / "manifest.json"
+MANIFEST_VERSION = 1
+
+TOPIC_FILE = re.compile(r"^t(\d+)_(\w+)\.py$")
+
+
+def _module_literals(tree: ast.Module) -> Dict:
+    """Collect `NAME = <literal>` assignments at module level"""
+    values = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and target.id.isupper():
+                try:
+                    values[target.id] = ast.literal_eval(node.value)
+                except ValueError:
+                    pass
+    return values
+
+
+def _lazy_import_target(node: ast.stmt) -> Optional[str]:
+    """Module name of a `name = lazy_import("module")` statement"""
+    if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)):
+        return None
+    call = node.value
+    if (isinstance(call.func, ast.Name) and call.func.id == "lazy_import"
+            and len(call.args) == 1 and isinstance(call.args[0], ast.Constant)):
+        return call.args[0].value
+    return None
+
+
+def _module_imports(tree: ast.Module) -> List[str]:
+    """Top-level and deferred imports of a module, in first-seen order"""
+    found = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        elif _lazy_import_target(node):
+            names = [_lazy_import_target(node)]
+        else:
+            continue
+        for name in names:
+            if name not in found:
+                found.append(name)
+    return found
+
+
+def _parse(path: Path) -> ast.Module:
+    return ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+
+def source_signature(topics_dir: Path = TOPICS_DIR) -> str:
+    """Cheap fingerprint of the topic sources (names, sizes and mtimes)"""
+    digest = hashlib.sha1()
+    for path in sorted(topics_dir.glob("*/*.py")):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(topics_dir)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def scan(topics_dir: Path = TOPICS_DIR) -> Dict:
+    """Scan the category packages and return the manifest as a dict"""
+    package_root = topics_dir.parent.name
+    categories = []
+
+    for package_dir in sorted(p for p in topics_dir.iterdir() if p.is_dir()):
+        init_file = package_dir / "__init__.py"
+        if not init_file.exists():
+            continue
+        package_meta = _module_literals(_parse(init_file))
+        if "CATEGORY" not in package_meta:
+            continue
+
+        package = f"{package_root}.{topics_dir.name}.{package_dir.name}"
+        topics = []
+        for path in sorted(package_dir.glob("t*.py")):
+            match = TOPIC_FILE.match(path.name)
+            if not match:
+                continue
+            tree = _parse(path)
+            meta = _module_literals(tree)
+            topics.append({
+                "id": match.group(2),
+                "title": meta.get("TITLE", match.group(2).replace("_", " ").title()),
+                "module": f"{package}.{path.stem}",
+                "order": meta.get("ORDER", int(match.group(1))),
+                "languages": list(meta.get("LANGUAGES", ["en"])),
+                "dependencies": _module_imports(tree),
+            })
+
+        topics.sort(key=lambda topic: (topic["order"], topic["module"]))
+        categories.append({
+            "title": package_meta["CATEGORY"],
+            "package": package,
+            "order": package_meta.get("ORDER", len(categories)),
+            "topics": topics,
+        })
+
+    categories.sort(key=lambda category: (category["order"], category["package"]))
+    return {
+        "version": MANIFEST_VERSION,
+        "signature": source_signature(topics_dir),
+        "categories": categories,
+    }
+
+
+def build_manifest(path: Path = MANIFEST_PATH, topics_dir: Path = TOPICS_DIR) -> Dict:
+    """Scan the topics and write the manifest file"""
+    manifest = scan(topics_dir)
+    path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return manifest
+
+
+def load_manifest(path: Path = MANIFEST_PATH, topics_dir: Path = TOPICS_DIR) -> Dict:
+    """Read the manifest, rescanning in memory if it is missing or stale"""
+    manifest: Optional[Dict] = None
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.info("No topic manifest at %s, scanning topics", path)
+
+    if manifest is not None and (
+        manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("signature") != source_signature(topics_dir)
+    ):
+        logger.warning("Topic manifest %s is stale, scanning topics", path)
+        manifest = None
+
+    return manifest if manifest is not None else scan(topics_dir)
+
+
+@functools.lru_cache(maxsize=None)
+def manifest() -> Dict:
+    """The manifest of this process, loaded on first use.
+
+    app.py runs again on every interaction; only the first run reads the
+    file and checks it against the sources. Shared: not to be changed.
+    """
+    return load_manifest()
+
+
+def as_topics(manifest: Dict) -> Dict[str, Dict[str, str]]:
+    """Turn a manifest into the {category: {topic title: module path}} tree"""
+    return {
+        category["title"]: {
+            topic["title"]: topic["module"]
+            for topic in category["topics"]
+        }
+        for category in manifest["categories"]
+    }
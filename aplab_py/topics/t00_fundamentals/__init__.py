@@ -0,0 +1,2 @@
+CATEGORY = "0. Programming Fundamentals"
+ORDER = 0
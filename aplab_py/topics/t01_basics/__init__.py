@@ -0,0 +1,2 @@
+CATEGORY = "1. Python Basics"
+ORDER = 1
@@ -0,0 +1,76 @@
+"""Runs against the installed Streamlit: the session records use its
+private SessionState, so a Streamlit upgrade that changes it fails here."""
+
+from streamlit.testing.v1 import AppTest
+
+from aplab_py.state import accounting
+from aplab_py.state.accounting import accounts
+
+
+def namespace_script():
+    import streamlit as st
+
+    from aplab_py.state.accounting import accounts
+
+    accounts.touch()
+    with accounts.namespace("topic"):
+        st.session_state["counter"] = 1
+
+
+def run_namespace():
+    accounts._records.clear()
+    at = AppTest.from_function(namespace_script, default_timeout=30).run()
+    assert not at.exception
+    return at
+
+
+def test_session_state_internals():
+    at = run_namespace()
+    record = accounts._records["test session id"]
+    assert record.owners == {"counter": "topic"}
+    usage = accounts.measure()[0]
+    assert usage.namespaces["topic"] > 0
+    assert "counter" in at.session_state
+
+
+def test_missing_internals_turn_accounting_off(monkeypatch):
+    monkeypatch.setattr(accounting, "_STATE_ATTRIBUTES", ("no_such_internal",))
+    monkeypatch.setattr(accounting, "_state_internals", True)
+    at = run_namespace()
+    assert accounts._records == {}
+    assert accounting._state_internals is False
+    assert at.session_state["counter"] == 1
+
+
+def spill_script():
+    import threading
+
+    import streamlit as st
+
+    from aplab_py.state.accounting import accounts
+
+    accounts.touch()
+    with accounts.namespace("topic"):
+        st.radio("Tab", ["one", "two"], key="tab")
+        st.session_state.setdefault("history", list(range(1000)))
+        st.session_state.setdefault("lock", threading.Lock())
+        st.text(f"{st.session_state.tab} {len(st.session_state.history)}")
+
+
+def test_spill_keeps_widgets_and_unpicklable_values(monkeypatch, tmp_path):
+    accounts._records.clear()
+    monkeypatch.setattr(accounting, "SESSION_SPILL_MIN_BYTES", 0)
+    monkeypatch.setattr(accounts, "budget", 0)
+    monkeypatch.setattr(accounts, "idle_seconds", 0)
+    monkeypatch.setattr(accounts, "spill_dir", str(tmp_path))
+    at = AppTest.from_function(spill_script, default_timeout=30).run()
+    at.radio(key="tab").set_value("two").run()
+
+    assert accounts.enforce() > 0
+    state = accounts._records["test session id"].state
+    assert "history" not in state
+    assert "tab" in state and "lock" in state
+
+    at.run()
+    assert not at.exception
+    assert at.text[0].value == "two 1000"
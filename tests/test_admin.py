@@ -0,0 +1,38 @@
+from streamlit.testing.v1 import AppTest
+
+from aplab_py.components import admin
+
+
+def requested_script():
+    import streamlit as st
+
+    from aplab_py.components import admin
+
+    st.text(str(admin.requested()))
+
+
+def run_requested(monkeypatch, configured, given):
+    monkeypatch.setattr(admin, "ADMIN_TOKEN", configured)
+    at = AppTest.from_function(requested_script, default_timeout=30)
+    if given is not None:
+        at.query_params[admin.ADMIN_PARAM] = given
+    at.run()
+    assert not at.exception
+    return at.text[0].value
+
+
+def test_matching_token(monkeypatch):
+    assert run_requested(monkeypatch, "s3cret", "s3cret") == "True"
+
+
+def test_wrong_token(monkeypatch):
+    assert run_requested(monkeypatch, "s3cret", "s3cre") == "False"
+
+
+def test_non_ascii_token(monkeypatch):
+    assert run_requested(monkeypatch, "s3cret", "sécret") == "False"
+    assert run_requested(monkeypatch, "sécret", "sécret") == "True"
+
+
+def test_no_token_configured(monkeypatch):
+    assert run_requested(monkeypatch, None, "s3cret") == "False"
@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from aplab_py.state import persistence
+
+APP = str(Path(__file__).resolve().parent.parent / "aplab_py" / "app.py")
+
+
+def cookie_setters(at):
+    return [frame for frame in at.get("iframe") if "document.cookie" in frame.proto.srcdoc]
+
+
+def test_learner_cookie_set_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(persistence, "SESSION_STORE_PATH", str(tmp_path / "sessions.sqlite3"))
+    monkeypatch.setattr(persistence, "_backend", None)
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.query_params["learner"] = "0" * 32
+    at.run()
+    assert not at.exception
+    learner = at.session_state["learner"]
+    assert learner != "0" * 32
+    assert "learner" not in at.query_params
+    assert len(cookie_setters(at)) == 1
+
+    at.run()
+    assert at.session_state["learner"] == learner
+    assert cookie_setters(at) == []
@@ -0,0 +1,90 @@
+import math
+
+import pytest
+
+from aplab_py.state.bounded import REPR_EDGE_ITEMS, CappedDict, CappedList, RingBuffer
+
+
+def test_ring_buffer_wraps_around():
+    history = RingBuffer(3, [1, 2])
+    for value in (3, 4, 5):
+        history.append(value)
+    assert list(history) == [3.0, 4.0, 5.0]
+    assert len(history) == 3
+    assert history[0] == 3.0 and history[-1] == 5.0 and history.last == 5.0
+    assert history.start == 2
+    with pytest.raises(IndexError):
+        history[3]
+
+
+def test_ring_buffer_stats_cover_dropped_values():
+    history = RingBuffer(2, [10, -4, 6])
+    assert history.stats.count == 3
+    assert history.stats.minimum == -4 and history.stats.maximum == 10
+    assert history.stats.mean == pytest.approx(4.0)
+    assert math.isnan(RingBuffer(2).stats.mean)
+
+
+def test_ring_buffer_overflows_to_infinity():
+    history = RingBuffer(4)
+    history.append(10 ** 400)
+    history.append(-(10 ** 400))
+    assert list(history) == [math.inf, -math.inf]
+    assert history.stored(10 ** 400) == math.inf
+
+
+def test_ring_buffer_int_typecode():
+    history = RingBuffer(2, [1, 2, 3], typecode="q")
+    assert list(history) == [2, 3]
+    assert all(isinstance(value, int) for value in history)
+
+
+def test_ring_buffer_copy_is_independent():
+    history = RingBuffer(3, [1, 2])
+    copy = history.copy()
+    copy.append(3)
+    assert list(history) == [1.0, 2.0] and history.stats.count == 2
+    assert list(copy) == [1.0, 2.0, 3.0] and copy.stats.count == 3
+
+
+@pytest.mark.parametrize("grow", [
+    lambda items: items.append(9),
+    lambda items: items.extend([7, 8, 9]),
+    lambda items: items.insert(0, 9),
+    lambda items: items.__iadd__([7, 8, 9]),
+    lambda items: items.__imul__(3),
+    lambda items: items.__setitem__(slice(len(items), None), [7, 8, 9]),
+])
+def test_capped_list_never_grows_past_capacity(grow):
+    items = CappedList([1, 2, 3], 4)
+    grow(items)
+    assert len(items) == 4
+    assert items.full
+
+
+def test_capped_list_drops_oldest():
+    items = CappedList(range(10), 3)
+    assert items == [7, 8, 9]
+    items.append(10)
+    assert items == [8, 9, 10]
+    items[0] = 0
+    assert items == [0, 9, 10]
+
+
+def test_capped_dict_drops_oldest_key():
+    items = CappedDict({"a": 1, "b": 2}, 2)
+    items["a"] = 10
+    assert items == {"a": 10, "b": 2}
+    items["c"] = 3
+    assert list(items) == ["b", "c"]
+    items.update(d=4)
+    assert list(items) == ["c", "d"]
+    assert items.setdefault("e", 5) == 5 and list(items) == ["d", "e"]
+
+
+def test_reprs_are_truncated():
+    items = CappedList(range(100), 100)
+    text = repr(items)
+    assert f"... {100 - 2 * REPR_EDGE_ITEMS} more ..." in text
+    assert text.startswith("[0, 1,") and text.endswith("98, 99]")
+    assert repr(CappedDict({"a": 1})) == "{'a': 1}"
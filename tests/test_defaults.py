@@ -0,0 +1,34 @@
+import pickle
+
+import pytest
+
+from aplab_py.state import persistence
+from aplab_py.state.bounded import CappedDict, CappedList, RingBuffer
+from aplab_py.state.defaults import freeze, thaw
+
+
+@pytest.mark.parametrize("value, change", [
+    (CappedList([1, 2, 3], 5), lambda value: value.append(4)),
+    (CappedDict({"a": 1}, 5), lambda value: value.update(b=2)),
+    (RingBuffer(5, [1.0, 2.0]), lambda value: value.append(3.0)),
+])
+def test_frozen_values_pickle_as_mutable(value, change):
+    frozen = freeze(value)
+    with pytest.raises(TypeError):
+        change(frozen)
+    for restored in (pickle.loads(pickle.dumps(frozen)),
+                     persistence.decode(persistence.encode(frozen))):
+        assert type(restored) in (CappedList, CappedDict, RingBuffer)
+        assert list(restored) == list(frozen)
+        assert restored.capacity == frozen.capacity
+        change(restored)
+
+
+def test_thaw_copies():
+    frozen = freeze(RingBuffer(3, [1.0, 2.0]))
+    copy = thaw(frozen)
+    copy.append(3.0)
+    copy.append(4.0)
+    assert list(frozen) == [1.0, 2.0]
+    assert list(copy) == [2.0, 3.0, 4.0]
+    assert copy.stats.count == 4
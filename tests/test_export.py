@@ -0,0 +1,14 @@
+from aplab_py import export
+
+
+def test_shared_sources_cover_package_but_other_topics():
+    names = {str(path.relative_to(export.PACKAGE_DIR)) for path in export.shared_sources()}
+    assert {
+        "routing.py",
+        "i18n/catalogs.py",
+        "i18n/locales/en.json",
+        "content/store.py",
+        "topics/discovery.py",
+        "state/bounded.py",
+    } <= names
+    assert not [name for name in names if "/t01_basics/t0" in name]
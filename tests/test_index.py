@@ -0,0 +1,79 @@
+import mmap
+
+import pytest
+
+from aplab_py.search import index
+from aplab_py.search.index import SearchIndex
+
+
+@pytest.fixture(scope="module")
+def data():
+    return index.build_bytes()
+
+
+@pytest.fixture
+def index_file(tmp_path, data):
+    path = tmp_path / "index.bin"
+    path.write_bytes(data)
+    return path
+
+
+def test_tokenize():
+    assert index.tokenize("A list_of 2 Words, x!") == ["list_of", "words"]
+
+
+def test_index_is_mapped_from_disk(index_file, data):
+    loaded = index._open(index_file)
+    assert isinstance(loaded._data, mmap.mmap)
+    assert loaded.signature == index.source_signature()
+    assert loaded.docs == SearchIndex(data).docs
+    assert ("variables", "1.1 Variables") in loaded.docs
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: data[:4] + bytes([index.INDEX_VERSION + 1]) + data[5:],
+    lambda data: data[:8] + b"0" * 40 + data[48:],
+    lambda data: b"",
+])
+def test_unusable_index_is_rebuilt_in_memory(index_file, data, damage):
+    index_file.write_bytes(damage(data))
+    loaded = index._open(index_file)
+    assert isinstance(loaded._data, bytes)
+    assert loaded.signature == index.source_signature()
+
+
+def test_title_matches_rank_first(data):
+    results = SearchIndex(data).search("variables")
+    assert results[0].topic_id == "variables"
+    scores = [result.score for result in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_every_word_must_match(data):
+    search = SearchIndex(data).search
+    assert search("variables zzzzqq") == []
+    assert search("  !! ") == []
+    assert {result.topic_id for result in search("data types")} <= {
+        result.topic_id for result in search("data")
+    }
+
+
+def test_last_word_is_a_prefix(data):
+    search = SearchIndex(data).search
+    assert search("vari")[0].topic_id == "variables"
+    assert search("vari ")[0].topic_id == "variables"
+    assert search("varia types") == []
+    assert search("types varia")[0].topic_id == "variables"
+    assert len(search("the", limit=2)) == 2
+
+
+def test_complete(data):
+    loaded = SearchIndex(data)
+    completions = loaded.complete("VAR", limit=3)
+    assert completions and len(completions) <= 3
+    assert all(term.startswith("var") for term in completions)
+    assert "variables" in loaded.complete("variab")
+    frequencies = [loaded._term(loaded._lower_bound(term.encode()))[3] for term in completions]
+    assert frequencies == sorted(frequencies, reverse=True)
+    assert loaded.complete("") == []
+    assert loaded.complete("zzzzqq") == []
@@ -0,0 +1,89 @@
+import sqlite3
+import time
+
+import pytest
+
+from aplab_py.state import persistence
+from aplab_py.state.bounded import CappedList
+from aplab_py.state.persistence import SQLiteBackend
+
+
+def test_encode_round_trip():
+    for value in (0, "text", CappedList(range(10), 5), list(range(1000))):
+        assert persistence.decode(persistence.encode(value)) == value
+
+
+def test_large_values_are_compressed():
+    blob = persistence.encode("x" * 10_000)
+    assert blob[1] & persistence.COMPRESSED
+    assert len(blob) < 1000
+
+
+def test_other_encoding_version_is_refused():
+    blob = persistence.encode(1)
+    with pytest.raises(ValueError):
+        persistence.decode(bytes([persistence.ENCODING_VERSION + 1]) + blob[1:])
+
+
+def test_learner_ids():
+    assert persistence.LEARNER_ID.fullmatch(persistence.new_learner_id())
+
+
+@pytest.fixture
+def backend(tmp_path):
+    # Long interval: the tests flush themselves
+    return SQLiteBackend(str(tmp_path / "sessions.sqlite3"), flush_seconds=3600)
+
+
+def rows(backend):
+    return sqlite3.connect(backend.path).execute(
+        "SELECT learner, namespace, key, value FROM session_state ORDER BY key"
+    ).fetchall()
+
+
+def test_saves_coalesce_by_key(backend):
+    for value in range(5):
+        backend.save("learner", "topic", "counter", persistence.encode(value))
+    backend.save("learner", "topic", "other", persistence.encode("x"))
+    assert backend.coalesced == 4
+
+    backend.flush()
+    assert backend.written == 2
+    assert [(key, persistence.decode(value)) for _, _, key, value in rows(backend)] == [
+        ("counter", 4), ("other", "x")
+    ]
+
+
+def test_load_sees_pending_saves(backend):
+    backend.save("learner", "topic", "stored", persistence.encode(1))
+    backend.flush()
+    backend.save("learner", "topic", "pending", persistence.encode(2))
+    backend.save("learner", "topic", "stored", None)
+    backend.save("learner", "other topic", "elsewhere", persistence.encode(3))
+
+    blobs = backend.load("learner", "topic")
+    assert {key: persistence.decode(blob) for key, blob in blobs.items()} == {"pending": 2}
+    assert backend.load("someone else", "topic") == {}
+
+
+def test_none_deletes_the_row(backend):
+    backend.save("learner", "topic", "key", persistence.encode(1))
+    backend.flush()
+    backend.save("learner", "topic", "key", None)
+    backend.flush()
+    assert rows(backend) == []
+
+
+def test_old_rows_are_pruned(backend):
+    backend.save("learner", "topic", "key", persistence.encode(1))
+    backend.flush()
+    connection = sqlite3.connect(backend.path)
+    with connection:
+        connection.execute("UPDATE session_state SET updated = ?", (time.time() - 10,))
+    backend.max_age_seconds = 5
+    backend.flush_seconds = 0.01
+    backend.save("learner", "topic", "fresh", persistence.encode(2))  # starts the writer
+    deadline = time.time() + 5
+    while [row[2] for row in rows(backend)] != ["fresh"] and time.time() < deadline:
+        time.sleep(0.05)
+    assert [row[2] for row in rows(backend)] == ["fresh"]
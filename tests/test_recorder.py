@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from aplab_py.algorithms.recorder import COMPARE, SET, SWAP, StepRecorder
+
+
+def bubble_sort(values, interval):
+    """A recording of bubble sort and the list after every operation"""
+    recorder = StepRecorder(values, interval)
+    snapshots = [list(values)]
+    n = recorder.size
+    for i in range(n):
+        for j in range(n - i - 1):
+            larger = recorder.compare(j, j + 1)
+            snapshots.append(recorder.current.tolist())
+            if larger:
+                recorder.swap(j, j + 1)
+                snapshots.append(recorder.current.tolist())
+    return recorder, snapshots
+
+
+@pytest.fixture
+def recording():
+    values = random.Random(0).sample(range(100), 12)
+    return bubble_sort(values, interval=16)
+
+
+def test_every_step_is_rebuilt(recording):
+    recorder, snapshots = recording
+    assert len(recorder) == len(snapshots) - 1
+    assert [recorder.state(step) for step in range(len(snapshots))] == snapshots
+    assert recorder.state(len(recorder)) == sorted(snapshots[0])
+
+
+def test_checkpoints_every_interval(recording):
+    recorder, snapshots = recording
+    assert len(recorder.checkpoints) == len(recorder) // recorder.interval + 1
+    for n, checkpoint in enumerate(recorder.checkpoints):
+        assert checkpoint.tolist() == snapshots[n * recorder.interval]
+
+
+def test_interval_is_at_least_the_list_size():
+    assert StepRecorder(range(10), interval=4).interval == 10
+    assert StepRecorder([], interval=0).interval == 1
+
+
+def test_replay_matches_state(recording):
+    recorder, snapshots = recording
+    steps = [0, 1, 15, 16, 17, 40, 40, len(recorder)]
+    assert list(recorder.replay(steps)) == [snapshots[step] for step in steps]
+    swaps = [0] + recorder.steps_after(SWAP)
+    assert list(recorder.replay(swaps)) == [snapshots[step] for step in swaps]
+
+
+def test_replay_rejects_bad_steps(recording):
+    recorder, _ = recording
+    with pytest.raises(ValueError):
+        list(recorder.replay([5, 4]))
+    with pytest.raises(IndexError):
+        list(recorder.replay([len(recorder) + 1]))
+    with pytest.raises(IndexError):
+        recorder.state(-1)
+
+
+def test_set_and_float_values():
+    recorder = StepRecorder([1.5, 2, 3], interval=2)
+    assert recorder.current.typecode == "d"
+    recorder.set(0, 9.25)
+    recorder.swap(0, 2)
+    recorder.set(1, -1)
+    assert [recorder.state(step) for step in range(4)] == [
+        [1.5, 2, 3], [9.25, 2, 3], [3, 2, 9.25], [3, -1, 9.25]
+    ]
+    assert list(recorder.kinds) == [SET, SWAP, SET]
+    assert recorder.steps_after(SET) == [1, 3]
+    assert recorder.steps_after(COMPARE) == []
@@ -0,0 +1,14 @@
+from aplab_py.registry import TopicRegistry
+
+
+def test_prefetch_starts_one_import(tmp_path, monkeypatch):
+    (tmp_path / "aplab_slow_topic.py").write_text("import time\ntime.sleep(0.3)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    registry = TopicRegistry({"Category": {"Slow": "aplab_slow_topic"}})
+
+    first = registry.prefetch("aplab_slow_topic")
+    assert registry.prefetch("aplab_slow_topic") is first
+    first.join()
+
+    assert registry.prefetch("aplab_slow_topic") is None
+    assert registry.timings["aplab_slow_topic"].seconds >= 0.3
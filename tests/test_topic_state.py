@@ -0,0 +1,17 @@
+from streamlit.testing.v1 import AppTest
+
+from aplab_py.state import topic_state
+
+DATA_TYPES = "aplab_py.topics.t01_basics.t02_data_types"
+
+
+def section_script():
+    from aplab_py.topics.t01_basics import t02_data_types
+
+    t02_data_types.list_builder()
+
+
+def test_section_run_counts_as_visit():
+    at = AppTest.from_function(section_script, default_timeout=30).run()
+    assert not at.exception
+    assert DATA_TYPES in at.session_state[topic_state.VISITS_KEY]